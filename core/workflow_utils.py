@@ -24,8 +24,11 @@ def load_workflow(path: str) -> dict:
 def save_workflow(workflow: dict, path: str) -> None:
     """Save a workflow dict to JSON file."""
     os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    # Serialize first, write once: json.dump streams the encoder's many
+    # small chunks straight into the file object.
+    text = json.dumps(workflow, indent=2, ensure_ascii=False)
     with open(path, "w", encoding="utf-8") as f:
-        json.dump(workflow, f, indent=2, ensure_ascii=False)
+        f.write(text)
 
 
 # ── Node Injection ──────────────────────────────────────────────────
@@ -9,8 +9,9 @@ from __future__ import annotations
 
 import sqlite3
 import os
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional, Iterator
+from typing import Iterator, Optional
 
 from loguru import logger
 
@@ -20,6 +21,9 @@ class Database:
 
     def __init__(self, db_path: str) -> None:
         self._path = Path(db_path)
+        # Set while inside transaction(); helpers route through it so a
+        # batch of writes shares one connection and one commit.
+        self._active: Optional[sqlite3.Connection] = None
 
     def initialize(self) -> None:
         """Create parent dirs and run migrations."""
@@ -31,23 +35,53 @@ class Database:
         """Get a new connection (caller must close it)."""
         return self._connect()
 
+    @contextmanager
+    def transaction(self):
+        """Run several statements on one connection with a single commit.
+
+        Nested calls reuse the outer connection; the outermost exit commits.
+        """
+        if self._active is not None:
+            yield self._active
+            return
+        conn = self._connect()
+        self._active = conn
+        try:
+            yield conn
+            conn.commit()
+        finally:
+            self._active = None
+            conn.close()
+
     def execute(self, sql: str, params: tuple = ()) -> None:
+        if self._active is not None:
+            self._active.execute(sql, params)
+            return
         with self._connect() as conn:
             conn.execute(sql, params)
             conn.commit()
 
     def execute_many(self, sql: str, params_list: list[tuple]) -> None:
+        if self._active is not None:
+            self._active.executemany(sql, params_list)
+            return
         with self._connect() as conn:
             conn.executemany(sql, params_list)
             conn.commit()
 
     def fetchone(self, sql: str, params: tuple = ()) -> Optional[dict]:
+        if self._active is not None:
+            row = self._active.execute(sql, params).fetchone()
+            return dict(row) if row else None
         with self._connect() as conn:
             cursor = conn.execute(sql, params)
             row = cursor.fetchone()
             return dict(row) if row else None
 
     def fetchall(self, sql: str, params: tuple = ()) -> list[dict]:
+        if self._active is not None:
+            rows = self._active.execute(sql, params).fetchall()
+            return [dict(row) for row in rows]
         with self._connect() as conn:
             cursor = conn.execute(sql, params)
             rows = cursor.fetchall()
@@ -56,10 +90,18 @@ class Database:
     # -- Internal --
 
     def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(str(self._path))
+        # Larger statement cache: callers pass module-constant SQL strings,
+        # so prepared statements survive across calls on one connection.
+        conn = sqlite3.connect(str(self._path), cached_statements=256)
         conn.row_factory = sqlite3.Row
         conn.execute("PRAGMA journal_mode=WAL")
         conn.execute("PRAGMA foreign_keys=ON")
+        # With WAL, NORMAL only fsyncs on checkpoint instead of every
+        # commit; temp structures and a 256MB mmap window keep sort/read
+        # paths off the filesystem.
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")
         return conn
 
     def _run_migrations(self) -> None:
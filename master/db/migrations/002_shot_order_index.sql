@@ -0,0 +1,7 @@
+-- Display ordering for shots.
+-- reorder_shots updates this column in place instead of deleting and
+-- reinserting every row (which rewrote all JSON columns just to change
+-- rowid order). Backfill from rowid to preserve the existing order.
+
+ALTER TABLE shots ADD COLUMN order_index INTEGER DEFAULT 0;
+UPDATE shots SET order_index = rowid;
@@ -0,0 +1,8 @@
+-- Per-project indexes for the list queries and the reorder path.
+-- id columns are PRIMARY KEY already, so single-id lookups were index
+-- hits; the project_id scans were not. (project_id, order_index) also
+-- serves get_shots' ORDER BY directly.
+
+CREATE INDEX IF NOT EXISTS idx_shots_project_order ON shots(project_id, order_index);
+CREATE INDEX IF NOT EXISTS idx_characters_project ON characters(project_id);
+CREATE INDEX IF NOT EXISTS idx_cinematics_project ON cinematics(project_id);
@@ -0,0 +1,8 @@
+-- Indexes for the job queue queries.
+-- get_pending_job runs WHERE status = ? ORDER BY created_at on every
+-- scheduler tick; (status, created_at) turns the full-table scan into a
+-- single B-tree seek. (project_id, created_at DESC) serves
+-- list_jobs(project_id=...) and its ordering.
+
+CREATE INDEX IF NOT EXISTS idx_jobs_status_created ON jobs(status, created_at);
+CREATE INDEX IF NOT EXISTS idx_jobs_project_created ON jobs(project_id, created_at DESC);
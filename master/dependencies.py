@@ -31,29 +31,32 @@ parameter_patcher = ParameterPatcher()
 health_monitor = HealthMonitor(scheduler)
 llm_service = LLMService()
 
-def get_data_manager() -> DataManager:
+# Providers are async so FastAPI resolves them inline on the event loop
+# instead of offloading each one to the anyio thread pool per request.
+
+async def get_data_manager() -> DataManager:
     return data_manager
 
-def get_job_manager() -> JobManager:
+async def get_job_manager() -> JobManager:
     return job_manager
 
-def get_local_executor() -> LocalExecutor:
+async def get_local_executor() -> LocalExecutor:
     return local_executor
 
-def get_worker_manager() -> WorkerManager:
+async def get_worker_manager() -> WorkerManager:
     return worker_manager
 
-def get_workflow_analyzer() -> WorkflowAnalyzer:
+async def get_workflow_analyzer() -> WorkflowAnalyzer:
     return workflow_analyzer
 
-def get_rule_engine() -> RuleEngine:
+async def get_rule_engine() -> RuleEngine:
     return rule_engine
 
-def get_scheduler() -> Scheduler:
+async def get_scheduler() -> Scheduler:
     return scheduler
 
-def get_parameter_patcher() -> ParameterPatcher:
+async def get_parameter_patcher() -> ParameterPatcher:
     return parameter_patcher
 
-def get_llm_service() -> LLMService:
+async def get_llm_service() -> LLMService:
     return llm_service
@@ -7,6 +7,14 @@ import os
 # 환경 변수 로드
 load_dotenv()
 
+# uvloop: 기본 selector 루프보다 태스크 스케줄링/소켓 I/O가 빠름
+# (Windows 등 미설치 환경에서는 기본 루프 사용)
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 # Logging and config (loguru setup runs on import)
 from .utils import logger, settings
 
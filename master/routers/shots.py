@@ -1,23 +1,43 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, UploadFile, File, Response
+from fastapi.responses import StreamingResponse
 from typing import List, Optional
 from pydantic import BaseModel
+import pandas as pd
+from openpyxl import load_workbook
 from ..models.shot import Shot
 from ..dependencies import get_data_manager, get_workflow_analyzer
 from ..services.data_manager import DataManager
 from ..services.workflow_analyzer import WorkflowAnalyzer
 from ..utils import id_generator, logger
 from datetime import datetime
+import io
 import os
 import sys
+import tempfile
 import subprocess
 import platform
 
+# Platform is fixed for the process lifetime; resolve it once at import
+# instead of calling platform.system() on every open_folder request.
+_SYS = platform.system()
+_IS_WINDOWS = _SYS == "Windows"
+_IS_DARWIN = _SYS == "Darwin"
+
 router = APIRouter(
     prefix="/shots",
     tags=["shots"]
 )
 
 
+# Columns written by /export, in display order. Only these fields are
+# materialized from each shot — no full model dump.
+EXPORT_COLS = (
+    'id', 'scene_description', 'status', 'duration_seconds',
+    'subjects_summary', 'env_location', 'tech_camera', 'tech_lens', 'tech_lighting',
+    'created_at', 'updated_at',
+)
+
+
 # Request models for new endpoints
 class CreateShotRequest(BaseModel):
     """Request body for creating a shot with server-side ID generation."""
@@ -27,11 +47,12 @@ class CreateShotRequest(BaseModel):
     status: Optional[str] = "pending"
 
 
-@router.get("/", response_model=List[Shot])
+@router.get("/")
 async def get_shots(manager: DataManager = Depends(get_data_manager)):
     if not manager.current_project_id:
         raise HTTPException(status_code=400, detail="No project loaded")
-    return manager.get_shots()
+    # Pre-serialized and revision-cached; skips Pydantic on repeat polls
+    return Response(content=manager.get_shots_json(), media_type="application/json")
 
 
 @router.post("/", response_model=Shot)
@@ -56,10 +77,9 @@ async def create_shot_with_server_id(
     if not manager.current_project_id:
         raise HTTPException(status_code=400, detail="No project loaded")
     
-    # Get existing shot IDs to ensure uniqueness
-    existing_shots = manager.get_shots()
-    existing_ids = [s.id for s in existing_shots]
-    
+    # Get existing shot IDs to ensure uniqueness (id column only, as a set)
+    existing_ids = manager.get_shot_ids()
+
     # Generate server-side ID
     new_id = id_generator.generate_shot_id(existing_ids)
     
@@ -138,10 +158,11 @@ async def bulk_update_shots(payload: dict, manager: DataManager = Depends(get_da
     updates = payload.get("updates", {})
     
     updated_count = 0
-    for shot_id in ids:
-        if manager.update_shot(shot_id, updates):
-            updated_count += 1
-            
+    with manager.batch():
+        for shot_id in ids:
+            if manager.update_shot(shot_id, updates):
+                updated_count += 1
+
     return {"message": "Bulk update successful", "updated_count": updated_count}
 
 @router.get("/export")
@@ -149,46 +170,32 @@ async def export_shots(manager: DataManager = Depends(get_data_manager)):
     if not manager.current_project_id:
         raise HTTPException(status_code=400, detail="No project loaded")
     
-    import pandas as pd
-    import io
-    from fastapi.responses import StreamingResponse
-    
     shots = manager.get_shots()
     if not shots:
         raise HTTPException(status_code=404, detail="No shots to export")
 
-    # Flatten Data for Export
-    export_data = []
+    # Build only the exported columns (column-oriented), skipping the full
+    # per-shot model dump and the filter/reorder pass over a wide DataFrame.
+    cols_data = {c: [] for c in EXPORT_COLS}
     for s in shots:
-        row = s.dict()
-        
+        cols_data['id'].append(s.id)
+        cols_data['scene_description'].append(s.scene_description)
+        cols_data['status'].append(s.status)
+        cols_data['duration_seconds'].append(s.duration_seconds)
         # Flatten Subjects (Just a summary for now, importing complex lists back is hard in CSV)
-        subjects = row.get('subjects', [])
-        row['subjects_summary'] = ", ".join([sub.get('character_id', 'Unknown') for sub in subjects]) if subjects else ""
-        
-        # Flatten Environment
-        env = row.get('environment', {}) or {}
-        row['env_location'] = env.get('location', '')
-        
-        # Flatten Technical
-        tech = row.get('technical', {}) or {}
-        row['tech_camera'] = tech.get('camera', '')
-        row['tech_lens'] = tech.get('lens', '')
-        row['tech_lighting'] = tech.get('lighting', '')
-        
-        export_data.append(row)
-        
-    df = pd.DataFrame(export_data)
+        cols_data['subjects_summary'].append(
+            ", ".join(sub.character_id for sub in s.subjects) if s.subjects else ""
+        )
+        cols_data['env_location'].append(s.environment.location if s.environment else '')
+        tech = s.technical
+        cols_data['tech_camera'].append(tech.camera if tech else '')
+        cols_data['tech_lens'].append(tech.lens if tech else '')
+        cols_data['tech_lighting'].append(tech.lighting if tech else '')
+        cols_data['created_at'].append(s.created_at)
+        cols_data['updated_at'].append(s.updated_at)
 
-    # Select/Order columns for better UX
-    cols = ['id', 'scene_description', 'status', 'duration_seconds',
-            'subjects_summary', 'env_location', 'tech_camera', 'tech_lens', 'tech_lighting',
-            'created_at', 'updated_at']
+    df = pd.DataFrame(cols_data, columns=EXPORT_COLS)
 
-    # Filter columns that exist
-    cols = [c for c in cols if c in df.columns]
-    df = df[cols]
-    
     stream = io.BytesIO()
     with pd.ExcelWriter(stream, engine='openpyxl') as writer:
         df.to_excel(writer, index=False, sheet_name='Shots')
@@ -202,27 +209,46 @@ async def export_shots(manager: DataManager = Depends(get_data_manager)):
     
     return StreamingResponse(stream, headers=headers, media_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')
 
-from fastapi import UploadFile, File
-
 @router.post("/import")
 async def import_shots(file: UploadFile = File(...), manager: DataManager = Depends(get_data_manager)):
     if not manager.current_project_id:
         raise HTTPException(status_code=400, detail="No project loaded")
-        
-    import pandas as pd
-    import io
-    
-    contents = await file.read()
+
+    # Stream the upload in chunks instead of buffering the whole file in RAM;
+    # spills to disk past 8MB so arbitrarily large workbooks stay bounded.
+    tmp = tempfile.SpooledTemporaryFile(max_size=8 << 20)
+    while chunk := await file.read(1 << 20):
+        tmp.write(chunk)
+    tmp.seek(0)
+
+    # Iterate worksheet rows directly (read-only mode streams them) instead of
+    # materializing a DataFrame plus a full to_dict('records') copy.
     try:
-        df = pd.read_excel(io.BytesIO(contents))
-        df = df.fillna('') # Handle NaN
+        wb = load_workbook(tmp, read_only=True, data_only=True)
+        rows_iter = wb.active.iter_rows(values_only=True)
+        header = next(rows_iter, None)
     except Exception as e:
+        tmp.close()
         raise HTTPException(status_code=400, detail=f"Invalid Excel file: {str(e)}")
-        
-    records = df.to_dict('records')
+
+    if header is None:
+        wb.close()
+        tmp.close()
+        return {"message": "Import successful", "updated": 0, "created": 0}
+
+    header = [str(h) if h is not None else '' for h in header]
+    records = (
+        # Empty cells arrive as None; normalize to '' like fillna('') did
+        {k: ('' if v is None else v) for k, v in zip(header, row_tuple)}
+        for row_tuple in rows_iter
+    )
+
     updated_count = 0
     created_count = 0
-    
+
+    # One timestamp for the whole batch; rows imported together share it
+    now_iso = datetime.now().isoformat()
+
     for row in records:
         # Pydantic conversion handles types, but we might need cleanup
         # Character IDs might be string "['A', 'B']" or just "A" in Excel
@@ -248,17 +274,18 @@ async def import_shots(file: UploadFile = File(...), manager: DataManager = Depe
                 if 'action' not in row: row['action'] = ""
                 
                 # Add timestamps if missing
-                from datetime import datetime
                 if 'created_at' not in row or not row['created_at']:
-                    row['created_at'] = datetime.now().isoformat()
-                row['updated_at'] = datetime.now().isoformat()
+                    row['created_at'] = now_iso
+                row['updated_at'] = now_iso
                 
                 shot = Shot(**row)
                 manager.add_shot(shot)
                 created_count += 1
             except Exception as e:
                 logger.warning(f"Skipping row {row.get('id')}: {e}")
-                
+
+    wb.close()
+    tmp.close()
     return {"message": "Import successful", "updated": updated_count, "created": created_count}
 
 @router.post("/{shot_id}/open_folder")
@@ -293,9 +320,9 @@ async def open_shot_folder(shot_id: str, manager: DataManager = Depends(get_data
         manager.fs.ensure_shot_structure(manager.current_project_id, seq_id, shot_id)
     
     try:
-        if platform.system() == "Windows":
+        if _IS_WINDOWS:
             os.startfile(path)
-        elif platform.system() == "Darwin":
+        elif _IS_DARWIN:
             subprocess.Popen(["open", path])
         else:
             subprocess.Popen(["xdg-open", path])
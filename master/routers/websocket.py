@@ -5,24 +5,55 @@ from ..services.worker_manager import WorkerManager
 from ..services.job_manager import JobManager
 from ..models.job import JobStatus
 from ..dependencies import get_worker_manager, get_job_manager, get_scheduler
-import json
+import functools
+
+import orjson
 
 router = APIRouter(tags=["websocket"])
 
 
+@functools.lru_cache(maxsize=16)
+def _gpu_mapper_for(keys: tuple):
+    """Return a mapper specialized for one agent's GPU dict schema.
+
+    A given agent version always sends the same GPU keys, so after the
+    first heartbeat the direct-index variant runs without .get() default
+    fallbacks. Schemas missing the expected keys fall back to the generic
+    mapper.
+    """
+    if "memory_total" in keys and "memory_used" in keys:
+        def mapper(raw_gpus: list[dict]) -> list[dict]:
+            return [
+                {"memory_total_mb": g["memory_total"], "memory_used_mb": g["memory_used"]}
+                for g in raw_gpus
+            ]
+    else:
+        def mapper(raw_gpus: list[dict]) -> list[dict]:
+            return [
+                {"memory_total_mb": g.get("memory_total", 0), "memory_used_mb": g.get("memory_used", 0)}
+                for g in raw_gpus
+            ]
+    return mapper
+
+
 def _map_gpu_data(raw_gpus: list[dict]) -> list[dict]:
     """Translate worker agent GPU keys to Scheduler-expected format.
 
     Agent sends: memory_total (MB), memory_used (MB), load (%), temperature (C)
     Scheduler expects: memory_total_mb, memory_used_mb
     """
-    return [
-        {
-            "memory_total_mb": g.get("memory_total", 0),
-            "memory_used_mb": g.get("memory_used", 0),
-        }
-        for g in raw_gpus
-    ]
+    if not raw_gpus:
+        return []
+    try:
+        return _gpu_mapper_for(tuple(sorted(raw_gpus[0].keys())))(raw_gpus)
+    except KeyError:
+        # Mixed schemas in one heartbeat: a later GPU dict lacks keys
+        # the first one advertised — use the tolerant mapping instead
+        # of letting the KeyError tear down the worker's websocket
+        return [
+            {"memory_total_mb": g.get("memory_total", 0), "memory_used_mb": g.get("memory_used", 0)}
+            for g in raw_gpus
+        ]
 
 
 @router.websocket("/ws/{client_id}")
@@ -38,7 +69,9 @@ async def websocket_endpoint(
         while True:
             data = await websocket.receive_text()
             try:
-                msg = json.loads(data)
+                # orjson parses the frame without the stdlib json overhead;
+                # agents send text frames, so receive_text stays.
+                msg = orjson.loads(data)
                 msg_type = msg.get("type")
 
                 if msg_type == "heartbeat":
@@ -92,9 +125,11 @@ async def websocket_endpoint(
                     job_manager.update_job_progress(job_id, progress)
 
                 else:
-                    logger.debug(f"Received from {client_id}: {data}")
+                    # Deferred formatting: the frame payload is only
+                    # stringified if DEBUG logging is actually enabled.
+                    logger.debug("Received from {}: {}", client_id, data)
 
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 pass
 
     except WebSocketDisconnect:
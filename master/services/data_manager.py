@@ -7,11 +7,20 @@ JSON import on first run.
 
 import json
 import os
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, List, Optional
+from operator import itemgetter
+from typing import Dict, Iterator, List, Optional, Tuple
 
+import orjson
 from loguru import logger
 
+# Optional: streaming parser for large legacy data.json imports
+try:
+    import ijson
+except ImportError:
+    ijson = None  # falls back to a full json.load
+
 from ..db.database import get_database
 from ..models.shot import Shot
 from ..models.character import Character
@@ -19,14 +28,206 @@ from ..models.cinematic import CinematicOption
 from .filesystem_service import FileSystemService
 
 
+def _now_iso() -> str:
+    return datetime.now().isoformat()
+
+
+def _dumps(obj) -> str:
+    """JSON-encode a value for a TEXT column (orjson, non-ASCII kept as-is)."""
+    return orjson.dumps(obj).decode()
+
+
+_loads = orjson.loads
+
+
+# SQL literals are module-level constants so the identical string object is
+# passed every call and sqlite3's internal statement cache can reuse the
+# prepared statement instead of re-parsing it.
+_GET_SHOTS_SQL = "SELECT * FROM shots WHERE project_id = ? ORDER BY order_index, rowid"
+_GET_SHOT_SQL = "SELECT * FROM shots WHERE id = ?"
+_GET_SHOT_IDS_SQL = "SELECT id FROM shots WHERE project_id = ?"
+_GET_SHOT_IDS_ORDERED_SQL = (
+    "SELECT id FROM shots WHERE project_id = ? ORDER BY order_index, rowid"
+)
+_NEXT_ORDER_INDEX_SQL = (
+    "SELECT COALESCE(MAX(order_index), -1) + 1 AS next_index "
+    "FROM shots WHERE project_id = ?"
+)
+_SET_ORDER_INDEX_SQL = "UPDATE shots SET order_index = ? WHERE project_id = ? AND id = ?"
+_GET_CHARACTERS_SQL = "SELECT * FROM characters WHERE project_id = ? ORDER BY rowid"
+_GET_CHARACTER_SQL = "SELECT * FROM characters WHERE id = ?"
+_GET_CINEMATICS_SQL = "SELECT * FROM cinematics WHERE project_id = ? ORDER BY rowid"
+_GET_CINEMATIC_SQL = "SELECT * FROM cinematics WHERE id = ?"
+
+# Columns whose values are JSON-encoded into TEXT
+_SHOT_JSON_COLUMNS = frozenset(
+    {"subjects", "environment", "technical", "character_ids", "reference_images"}
+)
+_CIN_JSON_COLUMNS = frozenset({"filters", "raw_data"})
+
+# Bind-order columns and per-column defaults for the INSERT statements
+# below. The row-tuple builders merge defaults in one dict splat and pluck
+# the bind tuple with a precompiled itemgetter instead of ~25 individual
+# data.get(...) calls per row.
+_SHOT_COLUMNS = (
+    "id", "project_id", "sequence_id", "scene_description", "dialogue",
+    "subjects", "environment", "technical",
+    "action", "character_ids", "cinematic_id",
+    "generated_prompt", "negative_prompt", "seed",
+    "reference_images", "generated_image_path", "generated_video_path",
+    "frame_count", "fps", "duration_seconds", "timecode_in", "timecode_out",
+    "status", "workflow_type", "created_at", "updated_at", "order_index",
+)
+_SHOT_DEFAULTS = {
+    "id": None, "sequence_id": None, "scene_description": "", "dialogue": None,
+    "subjects": [], "environment": {}, "technical": {},
+    "action": None, "character_ids": [], "cinematic_id": None,
+    "generated_prompt": None, "negative_prompt": None, "seed": None,
+    "reference_images": [], "generated_image_path": None,
+    "generated_video_path": None,
+    "frame_count": 24, "fps": 24.0, "duration_seconds": 1.0,
+    "timecode_in": None, "timecode_out": None,
+    "status": "pending", "workflow_type": "text_to_image",
+    "created_at": None, "updated_at": None, "order_index": 0,
+}
+_shot_bind = itemgetter(*_SHOT_COLUMNS)
+
+_CHAR_COLUMNS = (
+    "id", "project_id", "name", "description", "reference_sheet",
+    "lora_path", "lora_strength", "trigger_words", "use_lora",
+    "default_clothing", "created_at", "updated_at",
+)
+_CHAR_DEFAULTS = {
+    "id": None, "name": "", "description": "", "reference_sheet": None,
+    "lora_path": None, "lora_strength": 0.8, "trigger_words": "",
+    "use_lora": 0, "default_clothing": None,
+    "created_at": None, "updated_at": None,
+}
+_char_bind = itemgetter(*_CHAR_COLUMNS)
+
+_CIN_COLUMNS = (
+    "id", "project_id", "name", "category",
+    "camera_body", "focal_length", "lens_type", "film_stock",
+    "shot_type", "lighting",
+    "style", "environment", "atmosphere", "filters",
+    "raw_data", "created_at", "updated_at",
+)
+_CIN_DEFAULTS = {
+    "id": None, "name": "", "category": "General",
+    "camera_body": "Arri Alexa", "focal_length": "35mm",
+    "lens_type": "Anamorphic", "film_stock": None,
+    "shot_type": None, "lighting": None,
+    "style": "Cinematic", "environment": "", "atmosphere": "",
+    "filters": [], "raw_data": None,
+    "created_at": None, "updated_at": None,
+}
+_cin_bind = itemgetter(*_CIN_COLUMNS)
+
+# Model-facing keys: the storage columns minus the storage-only ones, so
+# the row converters build exactly the dict Pydantic needs instead of
+# copying the whole row and popping columns back off.
+_SHOT_MODEL_KEYS = tuple(
+    c for c in _SHOT_COLUMNS if c not in ("project_id", "order_index")
+)
+_CHAR_MODEL_KEYS = tuple(c for c in _CHAR_COLUMNS if c != "project_id")
+_CIN_MODEL_KEYS = tuple(c for c in _CIN_COLUMNS if c != "project_id")
+
+
+def _insert_sql(table: str, columns: tuple) -> str:
+    """INSERT OR REPLACE statement generated from a column tuple.
+
+    Keeps the SQL, the bind itemgetters and the model-key tuples all
+    driven off the same _*_COLUMNS definition — one list to maintain.
+    """
+    return (
+        f"INSERT OR REPLACE INTO {table} ({', '.join(columns)}) "
+        f"VALUES ({','.join('?' * len(columns))})"
+    )
+
+
+_SHOT_INSERT_SQL = _insert_sql("shots", _SHOT_COLUMNS)
+_CHAR_INSERT_SQL = _insert_sql("characters", _CHAR_COLUMNS)
+_CIN_INSERT_SQL = _insert_sql("cinematics", _CIN_COLUMNS)
+
+class _LazyProjectData(dict):
+    """Legacy ``_data`` view that materializes the heavy lists on demand.
+
+    ``load_project`` used to eagerly fetch every shot/character/cinematic,
+    build Pydantic models and dump them back to dicts just to fill this
+    mapping. Most callers never read it, so the three list keys are now
+    built only when actually accessed; everything else (e.g. the projects
+    router writing "description") behaves like a plain dict.
+    """
+
+    _LAZY = {
+        "shots": "get_shots",
+        "characters": "get_characters",
+        "cinematics": "get_cinematics",
+    }
+
+    def __init__(self, manager: "DataManager", **static):
+        super().__init__(**static)
+        self._manager = manager
+
+    def __getitem__(self, key):
+        if key in self._LAZY and key not in self:
+            return [m.dict() for m in getattr(self._manager, self._LAZY[key])()]
+        return super().__getitem__(key)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+
 class DataManager:
-    def __init__(self, projects_root: str = "projects"):
+    def __init__(self, projects_root: str = "projects", write_legacy_json: bool = False):
         self.projects_root = projects_root
+        # SQLite is the primary store; data.json is only read by
+        # _import_project_from_json (which handles its absence), so the
+        # write on project creation is opt-in.
+        self.write_legacy_json = write_legacy_json
         self.current_project_id: Optional[str] = None
         self._data: Dict = {}  # kept for backward compat during transition
         self.fs = FileSystemService(projects_root)
         self.db = get_database()
 
+        # Serialized-shots cache: bumped on every shot write so GET /shots
+        # polling can skip Pydantic + JSON serialization on cache hits.
+        self._shots_rev: int = 0
+        self._shots_json_cache: Optional[Tuple[tuple, bytes]] = None
+
+        # Shot-folder scaffolding deferred while inside batch(); flushed
+        # (deduplicated) once on exit instead of per add_shot call.
+        self._defer_fs: int = 0
+        self._pending_fs: set = set()
+
+        # Per-id model caches keyed by (project_id, id); invalidated on
+        # writes so repeated lookups skip the SELECT + parse + validate.
+        self._shot_cache: Dict[tuple, Shot] = {}
+        self._char_cache: Dict[tuple, Character] = {}
+        self._cin_cache: Dict[tuple, CinematicOption] = {}
+
+    @contextmanager
+    def batch(self):
+        """Group several writes into one SQLite transaction (single commit).
+
+        Shot-folder creation triggered by add_shot is deferred as well and
+        flushed once on exit, so bulk inserts aren't interleaved with
+        mkdir/stat syscalls.
+        """
+        self._defer_fs += 1
+        try:
+            with self.db.transaction():
+                yield
+        finally:
+            self._defer_fs -= 1
+            if self._defer_fs == 0 and self._pending_fs:
+                pending, self._pending_fs = self._pending_fs, set()
+                for project_id, seq, shot_id in pending:
+                    self.fs.ensure_shot_structure(project_id, seq, shot_id)
+
     # -- Project Management --
 
     def _get_project_path(self, project_id: str) -> str:
@@ -49,17 +250,19 @@ class DataManager:
             (project_id, "", now, now),
         )
 
-        # Also write legacy data.json for backward compat
-        initial_data = {
-            "project_id": project_id,
-            "created_at": now,
-            "shots": [],
-            "characters": [],
-            "cinematics": [],
-        }
-        data_path = self._get_data_file_path(project_id)
-        with open(data_path, "w", encoding="utf-8") as f:
-            json.dump(initial_data, f, indent=2, ensure_ascii=False)
+        # Legacy data.json write (opt-in; nothing reads it except the
+        # one-time JSON import, which tolerates its absence)
+        if self.write_legacy_json:
+            initial_data = {
+                "project_id": project_id,
+                "created_at": now,
+                "shots": [],
+                "characters": [],
+                "cinematics": [],
+            }
+            data_path = self._get_data_file_path(project_id)
+            with open(data_path, "wb") as f:
+                f.write(orjson.dumps(initial_data, option=orjson.OPT_INDENT_2))
 
         return True
 
@@ -74,14 +277,13 @@ class DataManager:
             self._import_project_from_json(project_id)
 
         self.current_project_id = project_id
+        self._shot_cache.clear()
+        self._char_cache.clear()
+        self._cin_cache.clear()
 
-        # Keep _data in sync for any code that still accesses it directly
-        self._data = {
-            "project_id": project_id,
-            "shots": [s.dict() for s in self.get_shots()],
-            "characters": [c.dict() for c in self.get_characters()],
-            "cinematics": [c.dict() for c in self.get_cinematics()],
-        }
+        # Lazy view for any code that still accesses _data directly; the
+        # shot/character/cinematic lists are only built if actually read.
+        self._data = _LazyProjectData(self, project_id=project_id)
 
     def save_project(self):
         """Update project timestamp. Legacy JSON sync."""
@@ -107,6 +309,57 @@ class DataManager:
             return
 
         logger.info(f"Importing project '{project_id}' from JSON to SQLite")
+        if ijson is not None:
+            n_shots, n_chars, n_cins = self._import_streaming(project_id, data_path)
+        else:
+            n_shots, n_chars, n_cins = self._import_full_load(project_id, data_path)
+        self._shots_rev += 1
+
+        logger.info(f"Imported project '{project_id}': {n_shots} shots, "
+                     f"{n_chars} characters, "
+                     f"{n_cins} cinematics")
+
+    def _import_streaming(self, project_id: str, data_path: str) -> tuple:
+        """Stream records out of data.json with ijson.
+
+        Only the top-level scalars plus one record at a time are held in
+        memory, instead of the whole dict tree of a large legacy project.
+        """
+        now = datetime.now().isoformat()
+
+        # Scalars live before the arrays in our data.json layout; stop
+        # scanning at the first array instead of parsing the whole file.
+        description, created_at = "", None
+        with open(data_path, "rb") as f:
+            for prefix, event, value in ijson.parse(f):
+                if event == "start_array":
+                    break
+                if prefix == "description":
+                    description = value
+                elif prefix == "created_at":
+                    created_at = value
+
+        self.db.execute(
+            "INSERT OR IGNORE INTO projects (id, description, created_at, updated_at) VALUES (?, ?, ?, ?)",
+            (project_id, description, created_at or now, now),
+        )
+
+        counts = []
+        with self.db.transaction():
+            for key, sql, builder in (
+                ("shots", _SHOT_INSERT_SQL, self._shot_row_tuple),
+                ("characters", _CHAR_INSERT_SQL, self._character_row_tuple),
+                ("cinematics", _CIN_INSERT_SQL, self._cinematic_row_tuple),
+            ):
+                with open(data_path, "rb") as f:
+                    rows = [builder(project_id, item, now) for item in ijson.items(f, f"{key}.item")]
+                if rows:
+                    self.db.execute_many(sql, rows)
+                counts.append(len(rows))
+        return tuple(counts)
+
+    def _import_full_load(self, project_id: str, data_path: str) -> tuple:
+        """Fallback import that loads the whole data.json at once."""
         with open(data_path, "r", encoding="utf-8") as f:
             data = json.load(f)
 
@@ -116,357 +369,412 @@ class DataManager:
             (project_id, data.get("description", ""), data.get("created_at", now), now),
         )
 
-        # Import shots
-        for s in data.get("shots", []):
-            self._upsert_shot_row(project_id, s)
+        # Batch each table into a single executemany inside one transaction:
+        # one commit for the whole import instead of one per row.
+        shots = data.get("shots", [])
+        characters = data.get("characters", [])
+        cinematics = data.get("cinematics", [])
+        with self.db.transaction():
+            if shots:
+                self.db.execute_many(
+                    _SHOT_INSERT_SQL,
+                    [self._shot_row_tuple(project_id, s, now) for s in shots],
+                )
+            if characters:
+                self.db.execute_many(
+                    _CHAR_INSERT_SQL,
+                    [self._character_row_tuple(project_id, c, now) for c in characters],
+                )
+            if cinematics:
+                self.db.execute_many(
+                    _CIN_INSERT_SQL,
+                    [self._cinematic_row_tuple(project_id, c, now) for c in cinematics],
+                )
+        return len(shots), len(characters), len(cinematics)
+
+    # -- Shots --
+
+    def iter_shots(self) -> Iterator[Shot]:
+        """Yield shots one at a time; peak memory stays at one row."""
+        if not self.current_project_id:
+            return
+        conn = self.db.connect()
+        try:
+            for row in conn.execute(_GET_SHOTS_SQL, (self.current_project_id,)):
+                yield self._shot_from_row(row)
+        finally:
+            conn.close()
 
-        # Import characters
-        for c in data.get("characters", []):
-            self._upsert_character_row(project_id, c)
+    def get_shots(self) -> List[Shot]:
+        return list(self.iter_shots())
 
-        # Import cinematics
-        for c in data.get("cinematics", []):
-            self._upsert_cinematic_row(project_id, c)
+    def get_shots_json(self) -> bytes:
+        """Serialized shot list for the current project, cached by revision.
 
-        logger.info(f"Imported project '{project_id}': {len(data.get('shots', []))} shots, "
-                     f"{len(data.get('characters', []))} characters, "
-                     f"{len(data.get('cinematics', []))} cinematics")
+        Returns the same payload FastAPI would produce for ``List[Shot]``,
+        but rebuilt only when a shot row actually changes, so steady-state
+        frontend polling bypasses per-field Pydantic serialization.
+        """
+        key = (self.current_project_id, self._shots_rev)
+        if self._shots_json_cache and self._shots_json_cache[0] == key:
+            return self._shots_json_cache[1]
 
-    # -- Shots --
+        payload = orjson.dumps([s.dict() for s in self.get_shots()])
+        self._shots_json_cache = (key, payload)
+        return payload
 
-    def get_shots(self) -> List[Shot]:
+    def get_shot_ids(self) -> set:
+        """IDs of all shots in the current project (id column only, no models)."""
         if not self.current_project_id:
-            return []
-        rows = self.db.fetchall(
-            "SELECT * FROM shots WHERE project_id = ? ORDER BY rowid",
-            (self.current_project_id,),
-        )
-        return [self._row_to_shot(r) for r in rows]
+            return set()
+        rows = self.db.fetchall(_GET_SHOT_IDS_SQL, (self.current_project_id,))
+        return {r["id"] for r in rows}
 
     def get_shot(self, shot_id: str) -> Optional[Shot]:
-        row = self.db.fetchone("SELECT * FROM shots WHERE id = ?", (shot_id,))
-        return self._row_to_shot(row) if row else None
-
-    def add_shot(self, shot: Shot):
+        key = (self.current_project_id, shot_id)
+        cached = self._shot_cache.get(key)
+        if cached is not None:
+            return cached
+        row = self.db.fetchone(_GET_SHOT_SQL, (shot_id,))
+        return self._shot_from_row(row) if row else None
+
+    def add_shot(self, shot: Shot) -> Shot:
         if not self.current_project_id:
             raise ValueError("No project loaded")
 
-        self._upsert_shot_row(self.current_project_id, shot.dict())
+        data = shot.dict()
+        # New shots go to the end of the display order
+        next_row = self.db.fetchone(_NEXT_ORDER_INDEX_SQL, (self.current_project_id,))
+        data["order_index"] = next_row["next_index"] if next_row else 0
+        self._upsert_shot_row(self.current_project_id, data)
+        # The caller's instance is already validated and matches the row
+        # we just wrote, so it goes straight into the cache and back out
+        self._shot_cache[(self.current_project_id, shot.id)] = shot
 
-        # Ensure FS structure
+        # Ensure FS structure (deferred to one pass inside batch())
         seq = shot.sequence_id or "SQ01"
-        self.fs.ensure_shot_structure(self.current_project_id, seq, shot.id)
+        if self._defer_fs:
+            self._pending_fs.add((self.current_project_id, seq, shot.id))
+        else:
+            self.fs.ensure_shot_structure(self.current_project_id, seq, shot.id)
+        return shot
 
     def update_shot(self, shot_id: str, updates: dict) -> Optional[Shot]:
-        existing = self.db.fetchone("SELECT * FROM shots WHERE id = ?", (shot_id,))
+        existing = self.db.fetchone(_GET_SHOT_SQL, (shot_id,))
         if not existing:
             return None
 
-        # Merge updates
+        # Write only columns whose values actually differ; idempotent
+        # patches (UI auto-save) become a read plus a cache hit
+        changed = {}
+        for k, v in updates.items():
+            if k not in existing or k == "id":
+                continue
+            if k in _SHOT_JSON_COLUMNS and isinstance(v, (list, dict)):
+                v = _dumps(v)
+            if existing[k] != v:
+                changed[k] = v
+        if not changed:
+            return self._shot_from_row(existing)
+
+        now = _now_iso()
+        sql = f"UPDATE shots SET {', '.join(f'{c} = ?' for c in changed)}, updated_at = ? WHERE id = ?"
+        self._shots_rev += 1
+        self.db.execute(sql, (*changed.values(), now, shot_id))
+
+        # Build the model from the merged dict instead of re-SELECTing
         shot_dict = dict(existing)
-        for key, value in updates.items():
-            if key in shot_dict:
-                shot_dict[key] = value
-
-        shot_dict["updated_at"] = datetime.now().isoformat()
+        shot_dict.update(changed)
+        shot_dict["updated_at"] = now
         project_id = shot_dict.get("project_id", self.current_project_id)
-        self._upsert_shot_row(project_id, shot_dict)
-
-        return self.get_shot(shot_id)
+        shot = self._row_to_shot(shot_dict)
+        self._shot_cache[(project_id, shot_id)] = shot
+        return shot
 
     def reorder_shots(self, shot_ids: List[str]) -> List[Shot]:
-        # SQLite rowid-based ordering: delete and re-insert in order
+        # In-place order_index update: only the id column is read (the
+        # JSON blob columns never leave disk) and no row data is rewritten
         if not self.current_project_id:
             return []
 
-        all_shots = self.db.fetchall(
-            "SELECT * FROM shots WHERE project_id = ?",
-            (self.current_project_id,),
-        )
-        shot_map = {s["id"]: s for s in all_shots}
-
-        # Build ordered list
-        ordered = []
-        for sid in shot_ids:
-            if sid in shot_map:
-                ordered.append(shot_map.pop(sid))
-        # Append any remaining shots not in the reorder list
-        for s in shot_map.values():
-            ordered.append(s)
-
-        # Delete and re-insert in order
-        self.db.execute(
-            "DELETE FROM shots WHERE project_id = ?",
-            (self.current_project_id,),
+        rows = self.db.fetchall(_GET_SHOT_IDS_ORDERED_SQL, (self.current_project_id,))
+        current_ids = [r["id"] for r in rows]
+        known = set(current_ids)
+
+        # Requested order first, then any remaining shots in their
+        # current relative order
+        ordered = [sid for sid in shot_ids if sid in known]
+        listed = set(ordered)
+        ordered.extend(sid for sid in current_ids if sid not in listed)
+
+        self._shots_rev += 1
+        self.db.execute_many(
+            _SET_ORDER_INDEX_SQL,
+            [(i, self.current_project_id, sid) for i, sid in enumerate(ordered)],
         )
-        for s in ordered:
-            self._upsert_shot_row(self.current_project_id, s)
 
         return self.get_shots()
 
     # -- Characters --
 
-    def get_characters(self) -> List[Character]:
+    def iter_characters(self) -> Iterator[Character]:
+        """Yield characters one at a time; peak memory stays at one row."""
         if not self.current_project_id:
-            return []
-        rows = self.db.fetchall(
-            "SELECT * FROM characters WHERE project_id = ? ORDER BY rowid",
-            (self.current_project_id,),
-        )
-        return [self._row_to_character(r) for r in rows]
+            return
+        conn = self.db.connect()
+        try:
+            for row in conn.execute(_GET_CHARACTERS_SQL, (self.current_project_id,)):
+                yield self._character_from_row(row)
+        finally:
+            conn.close()
+
+    def get_characters(self) -> List[Character]:
+        return list(self.iter_characters())
 
     def get_character(self, character_id: str) -> Optional[Character]:
-        row = self.db.fetchone("SELECT * FROM characters WHERE id = ?", (character_id,))
-        return self._row_to_character(row) if row else None
+        key = (self.current_project_id, character_id)
+        cached = self._char_cache.get(key)
+        if cached is not None:
+            return cached
+        row = self.db.fetchone(_GET_CHARACTER_SQL, (character_id,))
+        return self._character_from_row(row) if row else None
 
     def create_character(self, character: Character) -> Character:
         if not self.current_project_id:
             raise ValueError("No project loaded")
+        if not character.created_at or not character.updated_at:
+            # Mirror the timestamps _character_row_tuple fills in, so the
+            # cached instance agrees with the stored row
+            now = _now_iso()
+            character.created_at = character.created_at or now
+            character.updated_at = character.updated_at or now
         self._upsert_character_row(self.current_project_id, character.dict())
+        self._char_cache[(self.current_project_id, character.id)] = character
         return character
 
     def update_character(self, character_id: str, updates: dict) -> Optional[Character]:
-        existing = self.db.fetchone("SELECT * FROM characters WHERE id = ?", (character_id,))
+        existing = self.db.fetchone(_GET_CHARACTER_SQL, (character_id,))
         if not existing:
             return None
 
+        changed = {
+            k: v for k, v in updates.items()
+            if k in existing and k != "id" and existing[k] != v
+        }
+        if not changed:
+            return self._character_from_row(existing)
+
+        now = _now_iso()
+        sql = f"UPDATE characters SET {', '.join(f'{c} = ?' for c in changed)}, updated_at = ? WHERE id = ?"
+        self.db.execute(sql, (*changed.values(), now, character_id))
+
+        # Build the model from the merged dict instead of re-SELECTing
         char_dict = dict(existing)
-        for key, value in updates.items():
-            if key in char_dict:
-                char_dict[key] = value
-        char_dict["updated_at"] = datetime.now().isoformat()
+        char_dict.update(changed)
+        char_dict["updated_at"] = now
         project_id = char_dict.get("project_id", self.current_project_id)
-        self._upsert_character_row(project_id, char_dict)
-
-        return self.get_character(character_id)
+        character = self._row_to_character(char_dict)
+        self._char_cache[(project_id, character_id)] = character
+        return character
 
     def delete_character(self, character_id: str) -> bool:
         existing = self.db.fetchone("SELECT id FROM characters WHERE id = ?", (character_id,))
         if not existing:
             return False
+        self._char_cache.pop((self.current_project_id, character_id), None)
         self.db.execute("DELETE FROM characters WHERE id = ?", (character_id,))
         return True
 
     # -- Cinematics --
 
-    def get_cinematics(self) -> List[CinematicOption]:
+    def iter_cinematics(self) -> Iterator[CinematicOption]:
+        """Yield cinematics one at a time; peak memory stays at one row."""
         if not self.current_project_id:
-            return []
-        rows = self.db.fetchall(
-            "SELECT * FROM cinematics WHERE project_id = ? ORDER BY rowid",
-            (self.current_project_id,),
-        )
-        return [self._row_to_cinematic(r) for r in rows]
+            return
+        conn = self.db.connect()
+        try:
+            for row in conn.execute(_GET_CINEMATICS_SQL, (self.current_project_id,)):
+                yield self._cinematic_from_row(row)
+        finally:
+            conn.close()
+
+    def get_cinematics(self) -> List[CinematicOption]:
+        return list(self.iter_cinematics())
 
     def create_cinematic(self, option: CinematicOption) -> CinematicOption:
         if not self.current_project_id:
             raise ValueError("No project loaded")
+        if not option.created_at or not option.updated_at:
+            now = _now_iso()
+            option.created_at = option.created_at or now
+            option.updated_at = option.updated_at or now
         self._upsert_cinematic_row(self.current_project_id, option.dict())
+        self._cin_cache[(self.current_project_id, option.id)] = option
         return option
 
     def update_cinematic(self, option_id: str, updates: dict) -> Optional[CinematicOption]:
-        existing = self.db.fetchone("SELECT * FROM cinematics WHERE id = ?", (option_id,))
+        existing = self.db.fetchone(_GET_CINEMATIC_SQL, (option_id,))
         if not existing:
             return None
 
+        changed = {}
+        for k, v in updates.items():
+            if k not in existing or k == "id":
+                continue
+            if k in _CIN_JSON_COLUMNS and isinstance(v, (list, dict)):
+                v = _dumps(v)
+            if existing[k] != v:
+                changed[k] = v
+        if not changed:
+            return self._cinematic_from_row(existing)
+
+        now = _now_iso()
+        sql = f"UPDATE cinematics SET {', '.join(f'{c} = ?' for c in changed)}, updated_at = ? WHERE id = ?"
+        self.db.execute(sql, (*changed.values(), now, option_id))
+
+        # Build the model from the merged dict instead of re-SELECTing
         cin_dict = dict(existing)
-        for key, value in updates.items():
-            if key in cin_dict:
-                cin_dict[key] = value
-        cin_dict["updated_at"] = datetime.now().isoformat()
+        cin_dict.update(changed)
+        cin_dict["updated_at"] = now
         project_id = cin_dict.get("project_id", self.current_project_id)
-        self._upsert_cinematic_row(project_id, cin_dict)
-
-        return self.get_cinematic(option_id)
+        option = self._row_to_cinematic(cin_dict)
+        self._cin_cache[(project_id, option_id)] = option
+        return option
 
     def get_cinematic(self, option_id: str) -> Optional[CinematicOption]:
-        row = self.db.fetchone("SELECT * FROM cinematics WHERE id = ?", (option_id,))
-        return self._row_to_cinematic(row) if row else None
+        key = (self.current_project_id, option_id)
+        cached = self._cin_cache.get(key)
+        if cached is not None:
+            return cached
+        row = self.db.fetchone(_GET_CINEMATIC_SQL, (option_id,))
+        return self._cinematic_from_row(row) if row else None
 
     def delete_cinematic(self, option_id: str) -> bool:
         existing = self.db.fetchone("SELECT id FROM cinematics WHERE id = ?", (option_id,))
         if not existing:
             return False
+        self._cin_cache.pop((self.current_project_id, option_id), None)
         self.db.execute("DELETE FROM cinematics WHERE id = ?", (option_id,))
         return True
 
     # -- Row Conversion Helpers --
 
-    def _upsert_shot_row(self, project_id: str, data: dict) -> None:
-        """Insert or replace a shot row from a dict (model or raw)."""
-        subjects = data.get("subjects", [])
-        if isinstance(subjects, list):
-            subjects = json.dumps(subjects, ensure_ascii=False)
+    def _shot_from_row(self, row: dict) -> Shot:
+        """Memoized _row_to_shot keyed on (id, updated_at).
+
+        Rows unchanged since the last fetch reuse the already-validated
+        model instead of re-parsing five JSON columns and re-running
+        Pydantic validation per row.
+        """
+        key = (self.current_project_id, row["id"])
+        cached = self._shot_cache.get(key)
+        if cached is not None and cached.updated_at == row["updated_at"]:
+            return cached
+        shot = self._row_to_shot(row)
+        self._shot_cache[key] = shot
+        return shot
+
+    def _character_from_row(self, row: dict) -> Character:
+        key = (self.current_project_id, row["id"])
+        cached = self._char_cache.get(key)
+        if cached is not None and cached.updated_at == row["updated_at"]:
+            return cached
+        character = self._row_to_character(row)
+        self._char_cache[key] = character
+        return character
 
-        env = data.get("environment", {})
-        if isinstance(env, dict):
-            env = json.dumps(env, ensure_ascii=False)
+    def _cinematic_from_row(self, row: dict) -> CinematicOption:
+        key = (self.current_project_id, row["id"])
+        cached = self._cin_cache.get(key)
+        if cached is not None and cached.updated_at == row["updated_at"]:
+            return cached
+        option = self._row_to_cinematic(row)
+        self._cin_cache[key] = option
+        return option
 
-        tech = data.get("technical", {})
-        if isinstance(tech, dict):
-            tech = json.dumps(tech, ensure_ascii=False)
+    @staticmethod
+    def _shot_row_tuple(project_id: str, data: dict, now: Optional[str] = None) -> tuple:
+        """Build the bind tuple for _SHOT_INSERT_SQL (no DB access).
+
+        ``now`` lets batch callers share one timestamp string across rows.
+        """
+        merged = {**_SHOT_DEFAULTS, **data, "project_id": project_id}
+        for col in _SHOT_JSON_COLUMNS:
+            val = merged[col]
+            if isinstance(val, (list, dict)):
+                merged[col] = _dumps(val)
+        if not merged["created_at"] or not merged["updated_at"]:
+            # Only hit the clock when a timestamp is actually missing
+            now = now or _now_iso()
+            merged["created_at"] = merged["created_at"] or now
+            merged["updated_at"] = merged["updated_at"] or now
+        return _shot_bind(merged)
 
-        char_ids = data.get("character_ids", [])
-        if isinstance(char_ids, list):
-            char_ids = json.dumps(char_ids, ensure_ascii=False)
+    @staticmethod
+    def _character_row_tuple(project_id: str, data: dict, now: Optional[str] = None) -> tuple:
+        """Build the bind tuple for _CHAR_INSERT_SQL (no DB access)."""
+        merged = {**_CHAR_DEFAULTS, **data, "project_id": project_id}
+        merged["use_lora"] = 1 if merged["use_lora"] else 0
+        if not merged["created_at"] or not merged["updated_at"]:
+            now = now or _now_iso()
+            merged["created_at"] = merged["created_at"] or now
+            merged["updated_at"] = merged["updated_at"] or now
+        return _char_bind(merged)
 
-        ref_imgs = data.get("reference_images", [])
-        if isinstance(ref_imgs, list):
-            ref_imgs = json.dumps(ref_imgs, ensure_ascii=False)
+    @staticmethod
+    def _cinematic_row_tuple(project_id: str, data: dict, now: Optional[str] = None) -> tuple:
+        """Build the bind tuple for _CIN_INSERT_SQL (no DB access)."""
+        merged = {**_CIN_DEFAULTS, **data, "project_id": project_id}
+        for col in _CIN_JSON_COLUMNS:
+            val = merged[col]
+            if isinstance(val, (list, dict)):
+                merged[col] = _dumps(val)
+        if not merged["created_at"] or not merged["updated_at"]:
+            now = now or _now_iso()
+            merged["created_at"] = merged["created_at"] or now
+            merged["updated_at"] = merged["updated_at"] or now
+        return _cin_bind(merged)
 
-        self.db.execute(
-            """INSERT OR REPLACE INTO shots (
-                id, project_id, sequence_id, scene_description, dialogue,
-                subjects, environment, technical,
-                action, character_ids, cinematic_id,
-                generated_prompt, negative_prompt, seed,
-                reference_images, generated_image_path, generated_video_path,
-                frame_count, fps, duration_seconds, timecode_in, timecode_out,
-                status, workflow_type, created_at, updated_at
-            ) VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)""",
-            (
-                data.get("id"),
-                project_id,
-                data.get("sequence_id"),
-                data.get("scene_description", ""),
-                data.get("dialogue"),
-                subjects,
-                env,
-                tech,
-                data.get("action"),
-                char_ids,
-                data.get("cinematic_id"),
-                data.get("generated_prompt"),
-                data.get("negative_prompt"),
-                data.get("seed"),
-                ref_imgs,
-                data.get("generated_image_path"),
-                data.get("generated_video_path"),
-                data.get("frame_count", 24),
-                data.get("fps", 24.0),
-                data.get("duration_seconds", 1.0),
-                data.get("timecode_in"),
-                data.get("timecode_out"),
-                data.get("status", "pending"),
-                data.get("workflow_type", "text_to_image"),
-                data.get("created_at", datetime.now().isoformat()),
-                data.get("updated_at", datetime.now().isoformat()),
-            ),
-        )
+    def _upsert_shot_row(self, project_id: str, data: dict) -> None:
+        """Insert or replace a shot row from a dict (model or raw)."""
+        self._shots_rev += 1
+        self.db.execute(_SHOT_INSERT_SQL, self._shot_row_tuple(project_id, data))
 
     def _upsert_character_row(self, project_id: str, data: dict) -> None:
-        self.db.execute(
-            """INSERT OR REPLACE INTO characters (
-                id, project_id, name, description, reference_sheet,
-                lora_path, lora_strength, trigger_words, use_lora,
-                default_clothing, created_at, updated_at
-            ) VALUES (?,?,?,?,?,?,?,?,?,?,?,?)""",
-            (
-                data.get("id"),
-                project_id,
-                data.get("name", ""),
-                data.get("description", ""),
-                data.get("reference_sheet"),
-                data.get("lora_path"),
-                data.get("lora_strength", 0.8),
-                data.get("trigger_words", ""),
-                1 if data.get("use_lora") else 0,
-                data.get("default_clothing"),
-                data.get("created_at", datetime.now().isoformat()),
-                data.get("updated_at", datetime.now().isoformat()),
-            ),
-        )
+        self.db.execute(_CHAR_INSERT_SQL, self._character_row_tuple(project_id, data))
 
     def _upsert_cinematic_row(self, project_id: str, data: dict) -> None:
-        filters_val = data.get("filters", [])
-        if isinstance(filters_val, list):
-            filters_val = json.dumps(filters_val, ensure_ascii=False)
-
-        raw_data = data.get("raw_data")
-        if isinstance(raw_data, dict):
-            raw_data = json.dumps(raw_data, ensure_ascii=False)
-
-        self.db.execute(
-            """INSERT OR REPLACE INTO cinematics (
-                id, project_id, name, category,
-                camera_body, focal_length, lens_type, film_stock,
-                shot_type, lighting,
-                style, environment, atmosphere, filters,
-                raw_data, created_at, updated_at
-            ) VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)""",
-            (
-                data.get("id"),
-                project_id,
-                data.get("name", ""),
-                data.get("category", "General"),
-                data.get("camera_body", "Arri Alexa"),
-                data.get("focal_length", "35mm"),
-                data.get("lens_type", "Anamorphic"),
-                data.get("film_stock"),
-                data.get("shot_type"),
-                data.get("lighting"),
-                data.get("style", "Cinematic"),
-                data.get("environment", ""),
-                data.get("atmosphere", ""),
-                filters_val,
-                raw_data,
-                data.get("created_at", datetime.now().isoformat()),
-                data.get("updated_at", datetime.now().isoformat()),
-            ),
-        )
+        self.db.execute(_CIN_INSERT_SQL, self._cinematic_row_tuple(project_id, data))
 
     @staticmethod
-    def _row_to_shot(row: dict) -> Shot:
-        """Convert a SQLite row dict to a Shot model."""
-        data = dict(row)
-        # Parse JSON fields
-        for field in ("subjects", "character_ids", "reference_images"):
-            val = data.get(field)
-            if isinstance(val, str):
-                try:
-                    data[field] = json.loads(val)
-                except (json.JSONDecodeError, TypeError):
-                    data[field] = []
-
-        for field in ("environment", "technical"):
-            val = data.get(field)
-            if isinstance(val, str):
-                try:
-                    data[field] = json.loads(val)
-                except (json.JSONDecodeError, TypeError):
-                    data[field] = {}
-
-        # Remove project_id (not in Shot model)
-        data.pop("project_id", None)
+    def _row_to_shot(row) -> Shot:
+        """Convert a SQLite row (Row or dict) to a Shot model.
+
+        Only the model's own keys are copied out of the row (sqlite3.Row
+        indexes by name in O(1)), so there is no full-row dict copy and
+        no popping of storage-only columns. The writers always store
+        valid JSON text (schema defaults are '[]'/'{}'), so the columns
+        parse unguarded — no isinstance probing or try/except.
+        """
+        data = {k: row[k] for k in _SHOT_MODEL_KEYS}
+        data["subjects"] = _loads(data["subjects"]) if data["subjects"] else []
+        data["character_ids"] = _loads(data["character_ids"]) if data["character_ids"] else []
+        data["reference_images"] = _loads(data["reference_images"]) if data["reference_images"] else []
+        data["environment"] = _loads(data["environment"]) if data["environment"] else {}
+        data["technical"] = _loads(data["technical"]) if data["technical"] else {}
         return Shot(**data)
 
     @staticmethod
-    def _row_to_character(row: dict) -> Character:
-        data = dict(row)
-        data.pop("project_id", None)
+    def _row_to_character(row) -> Character:
+        data = {k: row[k] for k in _CHAR_MODEL_KEYS}
         # Convert use_lora from int to bool
-        data["use_lora"] = bool(data.get("use_lora", 0))
+        data["use_lora"] = bool(data["use_lora"])
         return Character(**data)
 
     @staticmethod
-    def _row_to_cinematic(row: dict) -> CinematicOption:
-        data = dict(row)
-        data.pop("project_id", None)
-
-        # Parse JSON fields
-        for field in ("filters",):
-            val = data.get(field)
-            if isinstance(val, str):
-                try:
-                    data[field] = json.loads(val)
-                except (json.JSONDecodeError, TypeError):
-                    data[field] = []
-
-        raw = data.get("raw_data")
-        if isinstance(raw, str):
-            try:
-                data["raw_data"] = json.loads(raw)
-            except (json.JSONDecodeError, TypeError):
-                data["raw_data"] = None
-
+    def _row_to_cinematic(row) -> CinematicOption:
+        data = {k: row[k] for k in _CIN_MODEL_KEYS}
+        data["filters"] = _loads(data["filters"]) if data["filters"] else []
+        raw = data["raw_data"]
+        data["raw_data"] = _loads(raw) if raw else None
         return CinematicOption(**data)
@@ -1,12 +1,78 @@
 import os
-import json
 import glob
+import re
 import shutil
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Optional, List, Dict
 from datetime import datetime
+
+import orjson
 from loguru import logger
 
 
+def _write_json(path: str, obj: dict) -> None:
+    """Serialize with orjson and write the whole buffer in one syscall.
+
+    The stdlib encoder streams many small chunks through the file
+    object; orjson produces the indented bytes in one shot.
+    """
+    with open(path, "wb") as f:
+        f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+
+
+def _read_json(path: str) -> dict:
+    with open(path, "rb") as f:
+        return orjson.loads(f.read())
+
+
+@lru_cache(maxsize=256)
+def _project_root(projects_root: str, project_id: str) -> str:
+    """Joined project root, cached — rebuilt on every shot/meta path
+    otherwise (os.path.join re-runs splitdrive/normalization each time)."""
+    return os.path.join(projects_root, project_id)
+
+
+# Shared pool for directory creation. mkdir is a kernel roundtrip that
+# can cost milliseconds each on the NFS/SMB mounts common in VFX
+# pipelines; siblings at the same depth are independent and overlap well.
+_MKDIR_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="fs-mkdir")
+
+
+def _mkdir_quiet(path: str) -> None:
+    try:
+        os.mkdir(path)
+    except FileExistsError:
+        pass
+
+
+def _make_tree(root: str, leaves) -> None:
+    """Create every leaf path under root with one mkdir per unique dir.
+
+    os.makedirs(..., exist_ok=True) re-probes each intermediate segment
+    on every call, so overlapping leaves (assets/characters, assets/fx,
+    ...) pay the same stat calls repeatedly. This collects the unique
+    directories once and treats "already exists" as success instead of
+    probing first. Directories are created depth by depth — each level
+    only depends on the one above it, so siblings within a level go to
+    the mkdir pool in parallel.
+    """
+    os.makedirs(root, exist_ok=True)
+    by_depth: dict = {}
+    for leaf in leaves:
+        path = root
+        for depth, part in enumerate(leaf.split("/")):
+            path = path + os.sep + part
+            by_depth.setdefault(depth, set()).add(path)
+    for depth in sorted(by_depth):
+        wave = by_depth[depth]
+        if len(wave) > 1:
+            list(_MKDIR_POOL.map(_mkdir_quiet, wave))
+        else:
+            _mkdir_quiet(next(iter(wave)))
+
+
 class FileSystemService:
     """
     Manages the physical file system structure following VFX production standards.
@@ -43,12 +109,56 @@ class FileSystemService:
     
     SHOT_TASKS = ["previz", "layout", "playblast", "render", "comp", "final"]
     ASSET_CATEGORIES = ["characters", "environments", "props", "fx"]
-    
+
+    # Upper bound on cached parsed meta files (LRU eviction)
+    META_CACHE_SIZE = 4096
+
+    # Relative directory skeleton created for every new project
+    _PROJECT_DIRS = (
+        "assets/characters",
+        "assets/environments",
+        "assets/props",
+        "assets/fx",
+        "scenes",
+        "edit/proxy",
+        "edit/edl",
+        "export/dailies",
+        "export/final",
+    )
+
+    # Characters stripped from asset folder names; \w keeps Unicode
+    # letters/digits like str.isalnum did (character names may be Korean)
+    _SAFE_RE = re.compile(r"[^\w\- ]")
+
     def __init__(self, projects_root: str = "projects"):
         self.projects_root = projects_root
+        # path -> ((mtime_ns, size), parsed meta); see _read_json_cached
+        self._meta_cache: OrderedDict = OrderedDict()
 
     def get_project_root(self, project_id: str) -> str:
-        return os.path.join(self.projects_root, project_id)
+        return _project_root(self.projects_root, project_id)
+
+    def _read_json_cached(self, path: str) -> dict:
+        """Read a meta file through an mtime-keyed LRU cache.
+
+        Polling dashboards hit list_shots repeatedly while nothing
+        changes; a file whose (mtime_ns, size) still matches is served
+        from memory instead of being re-read and re-parsed. Writers go
+        through _write_json, which bumps the mtime and so invalidates
+        naturally. Cached dicts are shared — callers must treat them as
+        read-only (the mutating paths use _read_json directly).
+        """
+        st = os.stat(path)
+        key = (st.st_mtime_ns, st.st_size)
+        hit = self._meta_cache.get(path)
+        if hit is not None and hit[0] == key:
+            self._meta_cache.move_to_end(path)
+            return hit[1]
+        meta = _read_json(path)
+        self._meta_cache[path] = (key, meta)
+        if len(self._meta_cache) > self.META_CACHE_SIZE:
+            self._meta_cache.popitem(last=False)
+        return meta
 
     def ensure_project_structure(self, project_id: str) -> str:
         """
@@ -57,21 +167,7 @@ class FileSystemService:
         """
         root = self.get_project_root(project_id)
         
-        # Create all directories
-        dirs = [
-            "assets/characters",
-            "assets/environments",
-            "assets/props",
-            "assets/fx",
-            "scenes",
-            "edit/proxy",
-            "edit/edl",
-            "export/dailies",
-            "export/final"
-        ]
-        
-        for d in dirs:
-            os.makedirs(os.path.join(root, d), exist_ok=True)
+        _make_tree(root, self._PROJECT_DIRS)
         
         # Create project config if not exists
         config_path = os.path.join(root, "project_config.json")
@@ -86,8 +182,7 @@ class FileSystemService:
                     "aspect_ratio": "16:9"
                 }
             }
-            with open(config_path, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2, ensure_ascii=False)
+            _write_json(config_path, config)
         
         logger.info(f"Project structure created: {root}")
         return root
@@ -113,8 +208,7 @@ class FileSystemService:
                 "description": "",
                 "shots": []
             }
-            with open(meta_path, 'w', encoding='utf-8') as f:
-                json.dump(meta, f, indent=2, ensure_ascii=False)
+            _write_json(meta_path, meta)
         
         return scene_path
 
@@ -140,8 +234,7 @@ class FileSystemService:
         )
         
         # Create task directories
-        for task in self.SHOT_TASKS:
-            os.makedirs(os.path.join(shot_path, task), exist_ok=True)
+        _make_tree(shot_path, self.SHOT_TASKS)
         
         # Create shot metadata
         if create_meta:
@@ -157,8 +250,7 @@ class FileSystemService:
                     "versions": {task: 0 for task in self.SHOT_TASKS},
                     "history": []
                 }
-                with open(meta_path, 'w', encoding='utf-8') as f:
-                    json.dump(meta, f, indent=2, ensure_ascii=False)
+                _write_json(meta_path, meta)
         
         logger.info(f"Shot structure created: {shot_path}")
         return shot_path
@@ -195,36 +287,42 @@ class FileSystemService:
         """
         shot_path = self.get_shot_dir(project_id, scene_id, shot_id)
         meta_path = os.path.join(shot_path, "shot_meta.json")
-        
-        if not os.path.exists(meta_path):
+
+        # One open in r+ mode: read, mutate, rewind and rewrite — no
+        # separate exists probe and no second open for the write
+        try:
+            f = open(meta_path, "r+b")
+        except FileNotFoundError:
             logger.error(f"Shot meta not found: {meta_path}")
             return False
-        
-        with open(meta_path, 'r', encoding='utf-8') as f:
-            meta = json.load(f)
-        
-        if meta.get("confirmed"):
-            logger.warning(f"Shot already confirmed: {shot_id}")
-            return True
-        
-        # Create v001 folders for key tasks
-        for task in ["previz", "render"]:
-            v001_path = os.path.join(shot_path, task, "v001")
-            os.makedirs(v001_path, exist_ok=True)
-        
-        # Update metadata
-        meta["confirmed"] = True
-        meta["confirmed_at"] = datetime.now().isoformat()
-        meta["versions"]["previz"] = 1
-        meta["versions"]["render"] = 1
-        meta["history"].append({
-            "action": "confirmed",
-            "timestamp": datetime.now().isoformat()
-        })
-        
-        with open(meta_path, 'w', encoding='utf-8') as f:
-            json.dump(meta, f, indent=2, ensure_ascii=False)
-        
+
+        with f:
+            meta = orjson.loads(f.read())
+
+            if meta.get("confirmed"):
+                logger.warning(f"Shot already confirmed: {shot_id}")
+                return True
+
+            # Create v001 folders for key tasks
+            for task in ["previz", "render"]:
+                v001_path = os.path.join(shot_path, task, "v001")
+                os.makedirs(v001_path, exist_ok=True)
+
+            # Update metadata
+            now = datetime.now().isoformat()
+            meta["confirmed"] = True
+            meta["confirmed_at"] = now
+            meta["versions"]["previz"] = 1
+            meta["versions"]["render"] = 1
+            meta["history"].append({
+                "action": "confirmed",
+                "timestamp": now
+            })
+
+            f.seek(0)
+            f.write(orjson.dumps(meta, option=orjson.OPT_INDENT_2))
+            f.truncate()
+
         logger.info(f"Shot confirmed: {shot_id}")
         return True
 
@@ -233,20 +331,26 @@ class FileSystemService:
         Gets the next version number for a task.
         """
         task_path = self.get_shot_dir(project_id, scene_id, shot_id, task)
-        
-        if not os.path.exists(task_path):
+
+        # scandir gives is_dir from the directory read itself (no stat
+        # per entry); keep a running max instead of building a list
+        best = 0
+        try:
+            with os.scandir(task_path) as it:
+                for entry in it:
+                    name = entry.name
+                    if (
+                        len(name) > 1
+                        and name[0] == "v"
+                        and name[1:].isdigit()
+                        and entry.is_dir(follow_symlinks=False)
+                    ):
+                        version = int(name[1:])
+                        if version > best:
+                            best = version
+        except FileNotFoundError:
             return 1
-        
-        # Find existing version folders
-        versions = []
-        for item in os.listdir(task_path):
-            if item.startswith("v") and os.path.isdir(os.path.join(task_path, item)):
-                try:
-                    versions.append(int(item[1:]))
-                except ValueError:
-                    pass
-        
-        return max(versions, default=0) + 1
+        return best + 1
 
     def create_version(
         self, 
@@ -257,31 +361,43 @@ class FileSystemService:
     ) -> str:
         """
         Creates a new version folder for a task and returns its path.
+
+        The meta file already tracks versions[task], so the version dir
+        scan is skipped entirely: one r+ open reads the counter, the
+        folder is created, and the same handle rewrites the meta.
         """
-        next_ver = self.get_next_version(project_id, scene_id, shot_id, task)
-        version_path = self.get_shot_dir(project_id, scene_id, shot_id, task, next_ver)
-        
-        os.makedirs(version_path, exist_ok=True)
-        
-        # Update shot meta
         shot_path = self.get_shot_dir(project_id, scene_id, shot_id)
         meta_path = os.path.join(shot_path, "shot_meta.json")
-        
-        if os.path.exists(meta_path):
-            with open(meta_path, 'r', encoding='utf-8') as f:
-                meta = json.load(f)
-            
+
+        try:
+            f = open(meta_path, "r+b")
+        except FileNotFoundError:
+            # Meta-less shot (create_meta=False): fall back to the scan
+            next_ver = self.get_next_version(project_id, scene_id, shot_id, task)
+            version_path = self.get_shot_dir(project_id, scene_id, shot_id, task, next_ver)
+            os.makedirs(version_path, exist_ok=True)
+            logger.info(f"Created version: {shot_id}/{task}/v{next_ver:03d}")
+            return version_path
+
+        with f:
+            meta = orjson.loads(f.read())
+
+            next_ver = meta["versions"].get(task, 0) + 1
+            version_path = self.get_shot_dir(project_id, scene_id, shot_id, task, next_ver)
+            os.makedirs(version_path, exist_ok=True)
+
             meta["versions"][task] = next_ver
             meta["history"].append({
-                "action": f"created_version",
+                "action": "created_version",
                 "task": task,
                 "version": next_ver,
                 "timestamp": datetime.now().isoformat()
             })
-            
-            with open(meta_path, 'w', encoding='utf-8') as f:
-                json.dump(meta, f, indent=2, ensure_ascii=False)
-        
+
+            f.seek(0)
+            f.write(orjson.dumps(meta, option=orjson.OPT_INDENT_2))
+            f.truncate()
+
         logger.info(f"Created version: {shot_id}/{task}/v{next_ver:03d}")
         return version_path
 
@@ -289,9 +405,8 @@ class FileSystemService:
         """
         Creates character asset folder structure.
         """
-        # Sanitize name
-        safe_name = "".join(c for c in character_name if c.isalnum() or c in ('_', '-', ' '))
-        safe_name = safe_name.replace(' ', '_')
+        # Sanitize name (single C-level pass instead of a per-char generator)
+        safe_name = self._SAFE_RE.sub('', character_name).replace(' ', '_')
         folder_name = f"CHR_{safe_name}"
         
         char_path = os.path.join(
@@ -302,8 +417,7 @@ class FileSystemService:
         )
         
         # Create subdirectories
-        os.makedirs(os.path.join(char_path, "lora"), exist_ok=True)
-        os.makedirs(os.path.join(char_path, "reference"), exist_ok=True)
+        _make_tree(char_path, ("lora", "reference"))
         
         # Create metadata
         meta_path = os.path.join(char_path, "character_meta.json")
@@ -316,34 +430,42 @@ class FileSystemService:
                 "trigger_words": [],
                 "reference_images": []
             }
-            with open(meta_path, 'w', encoding='utf-8') as f:
-                json.dump(meta, f, indent=2, ensure_ascii=False)
+            _write_json(meta_path, meta)
         
         return char_path
 
     def list_shots(self, project_id: str, scene_id: str = None) -> List[Dict]:
         """
         Lists all shots in a project or scene.
+
+        Uses scandir (directory type comes back cached from the readdir
+        call, no stat per entry) and reads each shot_meta.json directly,
+        treating a missing file as "no shot" instead of probing first.
         """
         shots = []
         scenes_path = os.path.join(self.get_project_root(project_id), "scenes")
-        
-        if not os.path.exists(scenes_path):
-            return shots
-        
-        scene_dirs = [scene_id] if scene_id else os.listdir(scenes_path)
-        
-        for scene in scene_dirs:
-            shots_path = os.path.join(scenes_path, scene, "shots")
-            if not os.path.exists(shots_path):
+
+        if scene_id:
+            scene_paths = [os.path.join(scenes_path, scene_id)]
+        else:
+            try:
+                with os.scandir(scenes_path) as it:
+                    scene_paths = [e.path for e in it if e.is_dir()]
+            except FileNotFoundError:
+                return shots
+
+        for scene_path in scene_paths:
+            try:
+                with os.scandir(os.path.join(scene_path, "shots")) as it:
+                    shot_dirs = [e.path for e in it if e.is_dir()]
+            except FileNotFoundError:
                 continue
-            
-            for shot_dir in os.listdir(shots_path):
-                meta_path = os.path.join(shots_path, shot_dir, "shot_meta.json")
-                if os.path.exists(meta_path):
-                    with open(meta_path, 'r', encoding='utf-8') as f:
-                        meta = json.load(f)
-                    shots.append(meta)
-        
+
+            for shot_dir in shot_dirs:
+                try:
+                    shots.append(self._read_json_cached(os.path.join(shot_dir, "shot_meta.json")))
+                except FileNotFoundError:
+                    pass
+
         return shots
 
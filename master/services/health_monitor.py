@@ -54,38 +54,39 @@ class HealthMonitor:
         logger.info("HealthMonitor stopped")
 
     async def _poll_loop(self):
-        """Main polling loop."""
+        """Main polling loop.
+
+        Scheduled against the loop's monotonic clock so the check work
+        does not stretch the period: each iteration sleeps until the
+        next multiple of poll_interval rather than interval-after-work.
+        """
+        loop = asyncio.get_running_loop()
+        next_t = loop.time()
         while self._running:
             try:
                 await self._check_all_workers()
             except Exception as e:
                 logger.error(f"HealthMonitor poll error: {e}")
-            await asyncio.sleep(self._poll_interval)
+            next_t += self._poll_interval
+            delay = next_t - loop.time()
+            if delay <= 0:
+                # A slow check overran the slot; re-anchor instead of
+                # firing a burst of catch-up polls
+                next_t = loop.time()
+                delay = 0
+            await asyncio.sleep(delay)
 
     async def _check_all_workers(self):
-        """Check all registered workers."""
-        now = datetime.now(timezone.utc)
-        workers = self._scheduler.get_all_workers()
-
-        for worker in workers:
-            if worker.status == "offline":
-                continue
-
-            # Check heartbeat timeout
-            if worker.last_heartbeat:
-                time_since = now - worker.last_heartbeat
-                if time_since > self._offline_threshold:
-                    logger.warning(
-                        f"Worker {worker.name} ({worker.worker_id}) has not "
-                        f"sent heartbeat in {time_since.total_seconds():.0f}s — marking offline"
-                    )
-                    self._scheduler.update_worker_status(
-                        worker.worker_id, "offline"
-                    )
-
-                    # Trigger recovery callback
-                    if self._on_worker_offline and worker.current_job_id:
-                        self._on_worker_offline(worker.worker_id)
+        """Sweep stale workers offline and trigger recovery callbacks."""
+        cutoff = datetime.now(timezone.utc) - self._offline_threshold
+        for worker in self._scheduler.mark_offline_before(cutoff):
+            logger.warning(
+                f"Worker {worker.name} ({worker.worker_id}) heartbeat older "
+                f"than {self._offline_threshold.total_seconds():.0f}s — marked offline"
+            )
+            # Trigger recovery callback
+            if self._on_worker_offline and worker.current_job_id:
+                self._on_worker_offline(worker.worker_id)
 
     def get_status(self) -> dict:
         """Get health monitor status."""
@@ -4,21 +4,60 @@ Job manager with SQLite persistence.
 Jobs survive server restarts. Based on DirectorsConsole JobRepository pattern.
 """
 
-import json
+import time
 from typing import List, Optional
 from datetime import datetime
 
+import orjson
 from loguru import logger
 
 from ..db.database import get_database
 from ..models.job import Job, JobStatus
 from ..services.data_manager import DataManager
 
+_UPDATE_PROGRESS_SQL = "UPDATE jobs SET progress = ? WHERE id = ?"
+
+# Buffered progress reports flush when either bound is hit
+_PROGRESS_FLUSH_INTERVAL = 0.2  # seconds
+_PROGRESS_FLUSH_MAX = 64  # distinct jobs
+
 
 class JobManager:
     def __init__(self, data_manager: DataManager):
         self.data_manager = data_manager
         self.db = get_database()
+        # job_id -> latest unflushed progress (last write wins)
+        self._pending_progress: dict[str, float] = {}
+        self._last_progress_flush = 0.0
+        # id -> Job; every write in this process goes through _save_job,
+        # so SQLite is persistence and the cache is authoritative
+        self._cache: dict[str, Job] = {}
+        self._preload_active_jobs()
+
+    def _preload_active_jobs(self) -> None:
+        """Warm the cache with every job that can still change state."""
+        rows = self.db.fetchall(
+            "SELECT * FROM jobs WHERE status IN (?, ?, ?)",
+            (
+                JobStatus.PENDING.value,
+                JobStatus.ASSIGNED.value,
+                JobStatus.RUNNING.value,
+            ),
+        )
+        for row in rows:
+            job = self._row_to_job(row)
+            self._cache[job.id] = job
+        if rows:
+            logger.info(f"Preloaded {len(rows)} active jobs into cache")
+
+    def _job_from_row(self, row: dict) -> Job:
+        """Reuse the cached Job for a row instead of reparsing it."""
+        cached = self._cache.get(row["id"])
+        if cached is not None:
+            return cached
+        job = self._row_to_job(row)
+        self._cache[job.id] = job
+        return job
 
     def create_job(self, project_id: str, shot_id: str, workflow_type: str, params: dict) -> Job:
         job = Job(
@@ -32,10 +71,15 @@ class JobManager:
         return job
 
     def get_job(self, job_id: str) -> Optional[Job]:
+        job = self._cache.get(job_id)
+        if job is not None:
+            return job
+        self.flush_progress()
         row = self.db.fetchone("SELECT * FROM jobs WHERE id = ?", (job_id,))
-        return self._row_to_job(row) if row else None
+        return self._job_from_row(row) if row else None
 
     def list_jobs(self, project_id: Optional[str] = None) -> List[Job]:
+        self.flush_progress()
         if project_id:
             rows = self.db.fetchall(
                 "SELECT * FROM jobs WHERE project_id = ? ORDER BY created_at DESC",
@@ -43,24 +87,47 @@ class JobManager:
             )
         else:
             rows = self.db.fetchall("SELECT * FROM jobs ORDER BY created_at DESC")
-        return [self._row_to_job(r) for r in rows]
+        return [self._job_from_row(r) for r in rows]
 
     def update_job_status(self, job_id: str, status: JobStatus, message: Optional[str] = None):
-        job = self.get_job(job_id)
-        if not job:
-            logger.warning(f"Job {job_id} not found for status update")
-            return
-
-        job.status = status
+        # Targeted UPDATE of just the fields that change — no SELECT
+        # first and no rewrite of the params/output_files blobs
+        now = datetime.now()
+        sets = ["status = ?"]
+        params: list = [status.value if isinstance(status, JobStatus) else status]
         if message:
-            job.error_message = message
+            sets.append("error_message = ?")
+            params.append(message)
 
+        started_at = completed_at = None
         if status == JobStatus.RUNNING:
-            job.started_at = datetime.now()
+            started_at = now
+            sets.append("started_at = ?")
+            params.append(now.isoformat())
         elif status in (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED):
-            job.completed_at = datetime.now()
+            completed_at = now
+            sets.append("completed_at = ?")
+            params.append(now.isoformat())
+        params.append(job_id)
 
-        self._save_job(job)
+        with self.db.transaction() as conn:
+            cur = conn.execute(
+                f"UPDATE jobs SET {', '.join(sets)} WHERE id = ?", tuple(params)
+            )
+            updated = cur.rowcount > 0
+        if not updated:
+            logger.warning(f"Job {job_id} not found for status update")
+            return
+
+        job = self._cache.get(job_id)
+        if job is not None:
+            job.status = status
+            if message:
+                job.error_message = message
+            if started_at:
+                job.started_at = started_at
+            if completed_at:
+                job.completed_at = completed_at
         logger.info(f"Job {job_id} status -> {status}")
 
     def get_pending_job(self) -> Optional[Job]:
@@ -69,7 +136,7 @@ class JobManager:
             "SELECT * FROM jobs WHERE status = ? ORDER BY created_at ASC LIMIT 1",
             (JobStatus.PENDING.value,),
         )
-        return self._row_to_job(row) if row else None
+        return self._job_from_row(row) if row else None
 
     def requeue_job(self, job: Job) -> None:
         """Re-queue a job that failed to be scheduled.
@@ -85,31 +152,71 @@ class JobManager:
         logger.info(f"Job {job.id} re-queued (no worker available)")
 
     def assign_job(self, job_id: str, worker_id: str):
-        job = self.get_job(job_id)
-        if job and job.status == JobStatus.PENDING:
+        # Conditional UPDATE makes the PENDING -> ASSIGNED transition
+        # atomic: a job can only be claimed once even if two scheduler
+        # passes race, and the JSON blobs are never rewritten
+        with self.db.transaction() as conn:
+            cur = conn.execute(
+                "UPDATE jobs SET status = ?, assigned_worker_id = ? "
+                "WHERE id = ? AND status = ?",
+                (
+                    JobStatus.ASSIGNED.value,
+                    worker_id,
+                    job_id,
+                    JobStatus.PENDING.value,
+                ),
+            )
+            claimed = cur.rowcount > 0
+        if not claimed:
+            return
+
+        job = self._cache.get(job_id)
+        if job is not None:
             job.status = JobStatus.ASSIGNED
             job.assigned_worker_id = worker_id
-            self._save_job(job)
-            logger.info(f"Job {job_id} assigned to worker {worker_id}")
+        logger.info(f"Job {job_id} assigned to worker {worker_id}")
 
     def update_job_progress(self, job_id: str, progress: float):
-        """Update job progress without full reload."""
-        self.db.execute(
-            "UPDATE jobs SET progress = ? WHERE id = ?",
-            (progress, job_id),
-        )
+        """Buffer a progress report; flushed in one batched transaction.
+
+        Workers report at 10+ Hz per job, and each report used to be its
+        own UPDATE + commit. Reports now coalesce per job (last write
+        wins) and flush together via executemany at most every 200 ms.
+        """
+        self._pending_progress[job_id] = progress
+        job = self._cache.get(job_id)
+        if job is not None:
+            job.progress = progress
+        if (
+            len(self._pending_progress) >= _PROGRESS_FLUSH_MAX
+            or time.monotonic() - self._last_progress_flush >= _PROGRESS_FLUSH_INTERVAL
+        ):
+            self.flush_progress()
+
+    def flush_progress(self) -> None:
+        """Write all buffered progress reports in one transaction."""
+        if not self._pending_progress:
+            return
+        batch = [(p, jid) for jid, p in self._pending_progress.items()]
+        self._pending_progress.clear()
+        self._last_progress_flush = time.monotonic()
+        self.db.execute_many(_UPDATE_PROGRESS_SQL, batch)
 
     def set_job_output_files(self, job_id: str, output_files: list[str]):
         """Update output files for a completed job."""
+        job = self._cache.get(job_id)
+        if job is not None:
+            job.output_files = output_files
         self.db.execute(
             "UPDATE jobs SET output_files = ? WHERE id = ?",
-            (json.dumps(output_files), job_id),
+            (orjson.dumps(output_files).decode(), job_id),
         )
 
     # -- Persistence helpers --
 
     def _save_job(self, job: Job) -> None:
-        """Insert or replace a job row."""
+        """Insert or replace a job row (write-through to the cache)."""
+        self._cache[job.id] = job
         self.db.execute(
             """INSERT OR REPLACE INTO jobs (
                 id, project_id, shot_id, workflow_type, params,
@@ -123,7 +230,7 @@ class JobManager:
                 job.project_id,
                 job.shot_id,
                 job.workflow_type,
-                json.dumps(job.params, ensure_ascii=False),
+                orjson.dumps(job.params).decode(),
                 job.vram_required_gb,
                 job.gpu_count_required,
                 job.status if isinstance(job.status, str) else job.status.value,
@@ -134,7 +241,7 @@ class JobManager:
                 job.started_at.isoformat() if isinstance(job.started_at, datetime) else job.started_at,
                 job.completed_at.isoformat() if isinstance(job.completed_at, datetime) else job.completed_at,
                 job.error_message,
-                json.dumps(job.output_files, ensure_ascii=False),
+                orjson.dumps(job.output_files).decode(),
             ),
         )
 
@@ -147,15 +254,15 @@ class JobManager:
         params = data.get("params", "{}")
         if isinstance(params, str):
             try:
-                data["params"] = json.loads(params)
-            except (json.JSONDecodeError, TypeError):
+                data["params"] = orjson.loads(params)
+            except orjson.JSONDecodeError:
                 data["params"] = {}
 
         output = data.get("output_files", "[]")
         if isinstance(output, str):
             try:
-                data["output_files"] = json.loads(output)
-            except (json.JSONDecodeError, TypeError):
+                data["output_files"] = orjson.loads(output)
+            except orjson.JSONDecodeError:
                 data["output_files"] = []
 
         # Parse datetimes
@@ -13,10 +13,53 @@ import os
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 from loguru import logger
 
+# SDK imports resolved once at module load; providers constructed per
+# job used to re-run the try/except dance on every instantiation
+try:
+    from openai import OpenAI
+    _HAS_OPENAI = True
+except ImportError:
+    _HAS_OPENAI = False
+
+try:
+    import anthropic
+    _HAS_ANTHROPIC = True
+except ImportError:
+    _HAS_ANTHROPIC = False
+
+try:
+    from google import genai
+    _HAS_GENAI = True
+except ImportError:
+    _HAS_GENAI = False
+
+
+# Each SDK client builds its own httpx connection pool, so sharing one
+# client per (api_key, base_url) keeps connections warm across provider
+# objects instead of re-handshaking per job.
+
+@lru_cache(maxsize=16)
+def _openai_client(api_key: str, base_url: Optional[str]):
+    kwargs = {"api_key": api_key}
+    if base_url:
+        kwargs["base_url"] = base_url
+    return OpenAI(**kwargs)
+
+
+@lru_cache(maxsize=16)
+def _anthropic_client(api_key: str):
+    return anthropic.Anthropic(api_key=api_key)
+
+
+@lru_cache(maxsize=16)
+def _genai_client(api_key: str):
+    return genai.Client(api_key=api_key)
+
 
 # ── Provider Registry ───────────────────────────────────────────────────────
 
@@ -94,16 +137,12 @@ class OpenAIProvider(LLMProvider):
     def __init__(self, config: LLMConfig):
         super().__init__(config)
         self._client = None
-        try:
-            from openai import OpenAI
-            api_key = config.api_key or os.environ.get("OPENAI_API_KEY")
-            if api_key:
-                kwargs = {"api_key": api_key}
-                if config.base_url:
-                    kwargs["base_url"] = config.base_url
-                self._client = OpenAI(**kwargs)
-        except ImportError:
+        if not _HAS_OPENAI:
             logger.warning("openai package not installed: pip install openai")
+            return
+        api_key = config.api_key or os.environ.get("OPENAI_API_KEY")
+        if api_key:
+            self._client = _openai_client(api_key, config.base_url)
 
     @property
     def is_available(self) -> bool:
@@ -151,13 +190,12 @@ class AnthropicProvider(LLMProvider):
         self._client = None
         if not config.model or config.model.startswith("gpt"):
             config.model = "claude-sonnet-4-20250514"
-        try:
-            import anthropic
-            api_key = config.api_key or os.environ.get("ANTHROPIC_API_KEY")
-            if api_key:
-                self._client = anthropic.Anthropic(api_key=api_key)
-        except ImportError:
+        if not _HAS_ANTHROPIC:
             logger.warning("anthropic package not installed: pip install anthropic")
+            return
+        api_key = config.api_key or os.environ.get("ANTHROPIC_API_KEY")
+        if api_key:
+            self._client = _anthropic_client(api_key)
 
     @property
     def is_available(self) -> bool:
@@ -177,16 +215,27 @@ class AnthropicProvider(LLMProvider):
             model=self.config.model,
             max_tokens=self.config.max_tokens,
             temperature=self.config.temperature,
-            system=system_prompt,
+            # The system prompt is byte-identical across calls; marking
+            # it cacheable reuses the server-side prefill instead of
+            # re-paying its input tokens every request
+            system=[
+                {
+                    "type": "text",
+                    "text": system_prompt,
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ],
             messages=[
                 {"role": "user", "content": effective_prompt},
             ],
         )
 
-        content = ""
-        for block in response.content:
-            if hasattr(block, "text"):
-                content += block.text
+        blocks = response.content
+        if len(blocks) == 1 and hasattr(blocks[0], "text"):
+            # Overwhelmingly common case: one text block
+            content = blocks[0].text
+        else:
+            content = "".join(b.text for b in blocks if hasattr(b, "text"))
 
         return LLMResponse(
             content=content,
@@ -210,13 +259,12 @@ class GeminiProvider(LLMProvider):
         self._client = None
         if not config.model or config.model.startswith("gpt") or config.model.startswith("claude"):
             config.model = "gemini-2.0-flash"
-        try:
-            from google import genai
-            api_key = config.api_key or os.environ.get("GOOGLE_API_KEY") or os.environ.get("GEMINI_API_KEY")
-            if api_key:
-                self._client = genai.Client(api_key=api_key)
-        except ImportError:
+        if not _HAS_GENAI:
             logger.warning("google-genai package not installed: pip install google-genai")
+            return
+        api_key = config.api_key or os.environ.get("GOOGLE_API_KEY") or os.environ.get("GEMINI_API_KEY")
+        if api_key:
+            self._client = _genai_client(api_key)
 
     @property
     def is_available(self) -> bool:
@@ -326,42 +374,38 @@ def list_available_providers() -> List[Dict[str, Any]]:
     result = []
 
     # OpenAI
-    try:
-        import openai
+    if _HAS_OPENAI:
         result.append({"id": "openai", "name": "OpenAI", "installed": True,
                        "models": ["gpt-4o", "gpt-4o-mini", "gpt-4", "gpt-3.5-turbo"],
                        "env_key": "OPENAI_API_KEY"})
-    except ImportError:
+    else:
         result.append({"id": "openai", "name": "OpenAI", "installed": False,
                        "install": "pip install openai"})
 
     # Anthropic
-    try:
-        import anthropic
+    if _HAS_ANTHROPIC:
         result.append({"id": "anthropic", "name": "Anthropic", "installed": True,
                        "models": ["claude-sonnet-4-20250514", "claude-3-5-sonnet-20241022", "claude-3-haiku-20240307"],
                        "env_key": "ANTHROPIC_API_KEY"})
-    except ImportError:
+    else:
         result.append({"id": "anthropic", "name": "Anthropic", "installed": False,
                        "install": "pip install anthropic"})
 
     # Gemini
-    try:
-        from google import genai
+    if _HAS_GENAI:
         result.append({"id": "gemini", "name": "Google Gemini", "installed": True,
                        "models": ["gemini-2.0-flash", "gemini-2.0-pro", "gemini-1.5-pro"],
                        "env_key": "GOOGLE_API_KEY"})
-    except ImportError:
+    else:
         result.append({"id": "gemini", "name": "Google Gemini", "installed": False,
                        "install": "pip install google-genai"})
 
     # OpenAI-Compatible (always available if openai is installed)
-    try:
-        import openai
+    if _HAS_OPENAI:
         result.append({"id": "openai_compatible", "name": "OpenAI-Compatible (Ollama/vLLM/LiteLLM)",
                        "installed": True, "models": ["any"],
                        "note": "Set base_url to your local endpoint"})
-    except ImportError:
+    else:
         result.append({"id": "openai_compatible", "name": "OpenAI-Compatible", "installed": False,
                        "install": "pip install openai"})
 
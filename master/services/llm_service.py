@@ -6,15 +6,67 @@ interface. Used for scenario analysis, prompt refinement, and AI-assisted
 shot planning.
 """
 
+import asyncio
+import hashlib
 import os
 import json
+import random
+import sqlite3
+import time
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Optional, AsyncIterator
 from enum import Enum
 from dataclasses import dataclass, field
 
+import orjson
+
 from ..utils import logger
 
 
+# HTTP statuses worth retrying: timeouts, rate limits, transient 5xx
+_RETRY_STATUS = frozenset({408, 429, 500, 502, 503, 504})
+
+# Conservative context-window sizes by model family; unknown models
+# assume 8k so truncation errs on the safe side
+_CONTEXT_LIMITS = (
+    ("gpt-4o", 128000),
+    ("gpt-4", 8192),
+    ("gpt-3.5", 16384),
+    ("claude", 200000),
+    ("gemini", 1000000),
+)
+# Headroom for the instruction scaffolding around the scenario text
+_PROMPT_OVERHEAD_TOKENS = 512
+
+
+def _context_limit(model: str) -> int:
+    for prefix, limit in _CONTEXT_LIMITS:
+        if model.startswith(prefix):
+            return limit
+    return 8192
+
+
+@lru_cache(maxsize=4)
+def _encoder(model: str):
+    """tiktoken encoder for the model, or None when not installed."""
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+
+
+def _count_tokens(text: str, model: str) -> int:
+    enc = _encoder(model)
+    if enc is not None:
+        return len(enc.encode(text))
+    return len(text) // 4  # rough heuristic: ~4 chars per token
+
+
 class LLMProvider(str, Enum):
     """Supported LLM providers."""
     OPENAI = "openai"
@@ -35,6 +87,10 @@ class LLMConfig:
     max_tokens: int = 2048
     system_prompt: str = "You are a professional cinematography assistant."
     timeout: float = 30.0
+    concurrency: int = 16  # bound for generate_many fan-out
+    request_timeout: float = 15.0  # per-attempt cap; retried, unlike timeout
+    max_retries: int = 3
+    cache_ttl: int = 86400  # seconds for the on-disk response cache; 0 disables
 
     @classmethod
     def from_env(cls) -> "LLMConfig":
@@ -57,14 +113,26 @@ class LLMConfig:
                 "LLM_SYSTEM_PROMPT",
                 "You are a professional cinematography and film production assistant.",
             ),
+            cache_ttl=int(os.getenv("LLM_CACHE_TTL", "86400")),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMMessage:
     """A single message in a conversation."""
     role: str  # "system", "user", "assistant"
     content: str
+    _dict: Optional[dict] = field(default=None, repr=False, compare=False)
+
+    def as_dict(self) -> dict:
+        """Wire-format dict, built once per message.
+
+        Every provider payload needs {"role", "content"}; long chat
+        histories were re-materializing these dicts per call.
+        """
+        if self._dict is None:
+            self._dict = {"role": self.role, "content": self.content}
+        return self._dict
 
 
 @dataclass
@@ -80,58 +148,433 @@ class LLMResponse:
 class LLMService:
     """Unified LLM service supporting multiple providers."""
 
+    # Responses are only cached for near-deterministic requests; at
+    # higher temperatures replaying an old completion is wrong
+    CACHE_MAX_TEMPERATURE = 0.2
+    CACHE_SIZE = 256
+    # The disk cache tolerates more sampling noise: refine_prompt runs
+    # at 0.5 and its results are stable enough to reuse across runs
+    DISK_CACHE_MAX_TEMPERATURE = 0.5
+
     def __init__(self, config: Optional[LLMConfig] = None):
         self._config = config or LLMConfig.from_env()
+        self._client = None  # shared httpx.AsyncClient, created lazily
+        self._disk_cache = None  # sqlite3 connection, created lazily
+        # request hash -> LLMResponse (LRU, see chat())
+        self._response_cache: OrderedDict = OrderedDict()
+        # request hash -> Future for the in-flight provider call, so
+        # concurrent identical requests share one network round trip
+        self._inflight: dict[bytes, asyncio.Future] = {}
+        # provider -> bound call method, built once instead of walking
+        # an if/elif chain on every chat()
+        self._dispatch = {
+            LLMProvider.OPENAI: self._call_openai,
+            LLMProvider.OLLAMA: self._call_ollama,
+            LLMProvider.ANTHROPIC: self._call_anthropic,
+            LLMProvider.GEMINI: self._call_gemini,
+        }
         logger.info(
             f"LLMService initialized: provider={self._config.provider.value}, "
             f"model={self._config.model}"
         )
 
+    def _get_client(self):
+        """Shared pooled HTTP client.
+
+        A fresh AsyncClient per call paid a TCP + TLS handshake for
+        every request; one pooled client reuses keep-alive connections
+        (and multiplexes over HTTP/2 when the h2 extra is installed).
+        """
+        if self._client is None:
+            import httpx
+            limits = httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=90,
+            )
+            try:
+                self._client = httpx.AsyncClient(
+                    http2=True, timeout=self._config.timeout, limits=limits
+                )
+            except ImportError:
+                # h2 not installed — keep-alive pooling still applies
+                self._client = httpx.AsyncClient(
+                    timeout=self._config.timeout, limits=limits
+                )
+        return self._client
+
+    async def aclose(self):
+        """Close the pooled client (call at app shutdown)."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _post_with_retry(self, url: str, **kwargs):
+        """POST with a per-attempt timeout and bounded, jittered retries.
+
+        A slow provider tail (sometimes 10x the median) used to stall
+        the whole call for the full blanket timeout, and a single
+        transient 429/5xx fell straight through to the mock response.
+        Each attempt is capped at request_timeout; timeouts and
+        retryable statuses back off exponentially with jitter, honoring
+        Retry-After when the provider sends one.
+        """
+        import httpx
+
+        client = self._get_client()
+        retries = self._config.max_retries
+        for attempt in range(retries):
+            try:
+                resp = await client.post(
+                    url, timeout=self._config.request_timeout, **kwargs
+                )
+            except httpx.TimeoutException:
+                if attempt + 1 >= retries:
+                    raise
+                delay = min(2 ** attempt + random.random(), 30.0)
+                logger.warning(
+                    f"LLM request timeout (attempt {attempt + 1}/{retries}), "
+                    f"retrying in {delay:.1f}s"
+                )
+                await asyncio.sleep(delay)
+                continue
+
+            if resp.status_code in _RETRY_STATUS and attempt + 1 < retries:
+                delay = min(2 ** attempt + random.random(), 30.0)
+                retry_after = resp.headers.get("Retry-After")
+                if retry_after:
+                    try:
+                        delay = max(delay, float(retry_after))
+                    except ValueError:
+                        pass
+                logger.warning(
+                    f"LLM request got {resp.status_code} "
+                    f"(attempt {attempt + 1}/{retries}), retrying in {delay:.1f}s"
+                )
+                await asyncio.sleep(delay)
+                continue
+
+            resp.raise_for_status()
+            return resp
+
+    async def _post_json(self, url: str, payload: dict, headers: Optional[dict] = None) -> dict:
+        """Shared transport for the provider calls.
+
+        One place where the pooled client, per-attempt timeout, retry
+        policy, and orjson body decode apply — the four _call_* methods
+        only build payloads and shape responses.
+        """
+        resp = await self._post_with_retry(url, headers=headers, json=payload)
+        return orjson.loads(resp.content)
+
+    def _get_disk_cache(self) -> sqlite3.Connection:
+        """Lazy connection to the on-disk response cache.
+
+        Lives next to the main database so deterministic pipeline-build
+        results (see generate()) survive server restarts.
+        """
+        if self._disk_cache is None:
+            from ..utils.config import settings
+
+            path = os.path.join(
+                os.path.dirname(settings.DATABASE_PATH), "llm_cache.db"
+            )
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            conn = sqlite3.connect(path)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, content TEXT, usage TEXT, "
+                "model TEXT, provider TEXT, ts INTEGER)"
+            )
+            conn.commit()
+            self._disk_cache = conn
+        return self._disk_cache
+
     async def generate(
         self,
         prompt: str,
         system_prompt: Optional[str] = None,
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
+        include_raw: bool = False,
     ) -> LLMResponse:
-        """Generate a response from the LLM."""
+        """Generate a response from the LLM.
+
+        Low-temperature calls are additionally served from a TTL'd
+        SQLite cache on disk — unlike the in-memory LRU in chat(), hits
+        here survive process restarts. cache_ttl=0 disables it.
+        """
         messages = [
             LLMMessage(role="system", content=system_prompt or self._config.system_prompt),
             LLMMessage(role="user", content=prompt),
         ]
-        return await self.chat(messages, temperature, max_tokens)
+        temp = temperature if temperature is not None else self._config.temperature
+        if (
+            self._config.cache_ttl <= 0
+            or temp > self.DISK_CACHE_MAX_TEMPERATURE
+            or include_raw  # raw payloads are never persisted, so a hit would drop them
+            or self._config.provider == LLMProvider.MOCK
+        ):
+            return await self.chat(messages, temperature, max_tokens, include_raw=include_raw)
 
-    async def chat(
+        tokens = max_tokens if max_tokens is not None else self._config.max_tokens
+        key = self._cache_key(messages, temp, tokens).hex()
+        conn = self._get_disk_cache()
+        row = conn.execute(
+            "SELECT content, usage, model, provider FROM cache WHERE key = ? AND ts > ?",
+            (key, int(time.time()) - self._config.cache_ttl),
+        ).fetchone()
+        if row is not None:
+            return LLMResponse(
+                content=row[0],
+                model=row[2],
+                provider=row[3],
+                usage=orjson.loads(row[1]),
+            )
+
+        response = await self.chat(messages, temp, tokens, include_raw=include_raw)
+        # Never persist the mock fallback a failed call returns
+        if response.provider != "mock":
+            conn.execute(
+                "INSERT OR REPLACE INTO cache (key, content, usage, model, provider, ts) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    response.content,
+                    orjson.dumps(response.usage).decode(),
+                    response.model,
+                    response.provider,
+                    int(time.time()),
+                ),
+            )
+            conn.commit()
+        return response
+
+    async def stream(
         self,
-        messages: list[LLMMessage],
+        prompt: str,
+        system_prompt: Optional[str] = None,
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
-    ) -> LLMResponse:
-        """Send a chat completion request."""
+    ) -> AsyncIterator[str]:
+        """Yield the completion incrementally as provider chunks arrive.
+
+        Callers can render or parse from the first token instead of
+        waiting for the full completion. Streaming is wired for the
+        OpenAI-compatible and Ollama endpoints; other providers fall
+        back to one buffered chunk from chat().
+        """
+        messages = [
+            LLMMessage(role="system", content=system_prompt or self._config.system_prompt),
+            LLMMessage(role="user", content=prompt),
+        ]
         temp = temperature if temperature is not None else self._config.temperature
         tokens = max_tokens if max_tokens is not None else self._config.max_tokens
 
         if self._config.provider == LLMProvider.OPENAI:
-            return await self._call_openai(messages, temp, tokens)
+            async for chunk in self._stream_openai(messages, temp, tokens):
+                yield chunk
         elif self._config.provider == LLMProvider.OLLAMA:
-            return await self._call_ollama(messages, temp, tokens)
-        elif self._config.provider == LLMProvider.ANTHROPIC:
-            return await self._call_anthropic(messages, temp, tokens)
-        elif self._config.provider == LLMProvider.GEMINI:
-            return await self._call_gemini(messages, temp, tokens)
+            async for chunk in self._stream_ollama(messages, temp, tokens):
+                yield chunk
         else:
+            response = await self.chat(messages, temp, tokens)
+            yield response.content
+
+    async def _stream_openai(
+        self, messages: list[LLMMessage], temperature: float, max_tokens: int,
+    ) -> AsyncIterator[str]:
+        """SSE token stream from an OpenAI-compatible endpoint."""
+        url = self._config.base_url or "https://api.openai.com/v1"
+        headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {self._config.api_key or ''}",
+        }
+        payload = {
+            "model": self._config.model,
+            "messages": [m.as_dict() for m in messages],
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "stream": True,
+        }
+
+        client = self._get_client()
+        async with client.stream(
+            "POST", f"{url}/chat/completions", headers=headers, json=payload
+        ) as resp:
+            resp.raise_for_status()
+            async for line in resp.aiter_lines():
+                if not line.startswith("data: "):
+                    continue
+                data = line[6:]
+                if data == "[DONE]":
+                    break
+                delta = json.loads(data)["choices"][0].get("delta", {})
+                text = delta.get("content")
+                if text:
+                    yield text
+
+    async def _stream_ollama(
+        self, messages: list[LLMMessage], temperature: float, max_tokens: int,
+    ) -> AsyncIterator[str]:
+        """NDJSON token stream from the Ollama chat endpoint."""
+        url = self._config.base_url or "http://localhost:11434"
+        payload = {
+            "model": self._config.model,
+            "messages": [m.as_dict() for m in messages],
+            "stream": True,
+            "options": {
+                "temperature": temperature,
+                "num_predict": max_tokens,
+            },
+        }
+
+        client = self._get_client()
+        async with client.stream("POST", f"{url}/api/chat", json=payload) as resp:
+            resp.raise_for_status()
+            async for line in resp.aiter_lines():
+                if not line:
+                    continue
+                data = json.loads(line)
+                text = data.get("message", {}).get("content", "")
+                if text:
+                    yield text
+                if data.get("done"):
+                    break
+
+    async def generate_many(
+        self,
+        prompts: list[str],
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        concurrency: Optional[int] = None,
+    ) -> list:
+        """Fan generate() out over many prompts with bounded concurrency.
+
+        Requests run through one asyncio.Semaphore so a large batch
+        overlaps network waits instead of awaiting serially. Results
+        come back in prompt order; a failed call yields its exception
+        in place so one bad prompt does not sink the batch.
+        """
+        sem = asyncio.Semaphore(concurrency or self._config.concurrency)
+
+        async def one(prompt: str):
+            async with sem:
+                try:
+                    return await self.generate(
+                        prompt, system_prompt, temperature, max_tokens
+                    )
+                except Exception as exc:
+                    return exc
+
+        # TaskGroup gives structured cancellation: if the caller is
+        # cancelled, every in-flight task is torn down with it.
+        # Not available before Python 3.11 — this repo supports 3.10,
+        # where gather() is equivalent since one() never raises.
+        if hasattr(asyncio, "TaskGroup"):
+            async with asyncio.TaskGroup() as tg:
+                tasks = [tg.create_task(one(p)) for p in prompts]
+            return [t.result() for t in tasks]
+        return list(await asyncio.gather(*(one(p) for p in prompts)))
+
+    async def chat(
+        self,
+        messages: list[LLMMessage],
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        include_raw: bool = False,
+    ) -> LLMResponse:
+        """Send a chat completion request.
+
+        raw_response is only populated when include_raw is set —
+        retaining the full provider payload for every call kept
+        multi-KB dicts alive in the response cache for no reader.
+
+        Low-temperature requests are served from an in-memory LRU keyed
+        on (provider, model, sampling params, messages) — shot pipelines
+        re-ask identical questions often, and each hit saves a full
+        provider round trip.
+
+        Identical requests that are already in flight are coalesced:
+        followers await the leader's Future instead of launching their
+        own provider call. generate_many over a batch with duplicate
+        prompts makes one network call per distinct request.
+        """
+        temp = temperature if temperature is not None else self._config.temperature
+        tokens = max_tokens if max_tokens is not None else self._config.max_tokens
+
+        if self._config.provider == LLMProvider.MOCK:
             return self._mock_response(messages)
 
+        if include_raw:
+            # Cached and coalesced responses never carry raw_response
+            # (the flag isn't part of the cache key), so a raw request
+            # must go straight to the provider
+            call = self._dispatch.get(self._config.provider)
+            if call is None:
+                return self._mock_response(messages)
+            return await call(messages, temp, tokens, True)
+
+        key = self._cache_key(messages, temp, tokens)
+
+        if temp <= self.CACHE_MAX_TEMPERATURE:
+            cached = self._response_cache.get(key)
+            if cached is not None:
+                self._response_cache.move_to_end(key)
+                return cached
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            # shield: a cancelled follower must not cancel the shared
+            # Future out from under the leader and other followers
+            return await asyncio.shield(pending)
+        fut: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = fut
+
+        try:
+            call = self._dispatch.get(self._config.provider)
+            if call is not None:
+                response = await call(messages, temp, tokens, include_raw)
+            else:
+                response = self._mock_response(messages)
+        except BaseException as exc:
+            self._inflight.pop(key, None)
+            if not fut.done():
+                fut.set_exception(exc)
+                fut.exception()  # mark retrieved even with no followers
+            raise
+
+        self._inflight.pop(key, None)
+        if not fut.done():
+            fut.set_result(response)
+
+        # Never cache the mock fallback a failed call returns
+        if temp <= self.CACHE_MAX_TEMPERATURE and response.provider != "mock":
+            self._response_cache[key] = response
+            if len(self._response_cache) > self.CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+        return response
+
+    def _cache_key(
+        self, messages: list[LLMMessage], temperature: float, max_tokens: int
+    ) -> bytes:
+        h = hashlib.sha256(
+            f"{self._config.provider.value}|{self._config.model}"
+            f"|{temperature}|{max_tokens}".encode()
+        )
+        for m in messages:
+            h.update(b"\x00")
+            h.update(m.role.encode())
+            h.update(b"\x01")
+            h.update(m.content.encode())
+        return h.digest()
+
     async def _call_openai(
         self, messages: list[LLMMessage], temperature: float, max_tokens: int,
+        include_raw: bool = False,
     ) -> LLMResponse:
         """Call OpenAI-compatible API (also works with LM Studio, vLLM, etc.)."""
-        try:
-            import httpx
-        except ImportError:
-            logger.error("httpx is required for OpenAI provider. Install: pip install httpx")
-            return self._mock_response(messages)
-
         url = self._config.base_url or "https://api.openai.com/v1"
         headers = {
             "Content-Type": "application/json",
@@ -139,46 +582,33 @@ class LLMService:
         }
         payload = {
             "model": self._config.model,
-            "messages": [{"role": m.role, "content": m.content} for m in messages],
+            "messages": [m.as_dict() for m in messages],
             "temperature": temperature,
             "max_tokens": max_tokens,
         }
 
         try:
-            async with httpx.AsyncClient(timeout=self._config.timeout) as client:
-                resp = await client.post(
-                    f"{url}/chat/completions",
-                    headers=headers,
-                    json=payload,
-                )
-                resp.raise_for_status()
-                data = resp.json()
-
-                return LLMResponse(
-                    content=data["choices"][0]["message"]["content"],
-                    model=data.get("model", self._config.model),
-                    provider="openai",
-                    usage=data.get("usage", {}),
-                    raw_response=data,
-                )
+            data = await self._post_json(f"{url}/chat/completions", payload, headers)
+            return LLMResponse(
+                content=data["choices"][0]["message"]["content"],
+                model=data.get("model", self._config.model),
+                provider="openai",
+                usage=data.get("usage", {}),
+                raw_response=data if include_raw else None,
+            )
         except Exception as e:
             logger.error(f"OpenAI API error: {e}")
             return self._mock_response(messages)
 
     async def _call_ollama(
         self, messages: list[LLMMessage], temperature: float, max_tokens: int,
+        include_raw: bool = False,
     ) -> LLMResponse:
         """Call Ollama local API."""
-        try:
-            import httpx
-        except ImportError:
-            logger.error("httpx is required for Ollama provider")
-            return self._mock_response(messages)
-
         url = self._config.base_url or "http://localhost:11434"
         payload = {
             "model": self._config.model,
-            "messages": [{"role": m.role, "content": m.content} for m in messages],
+            "messages": [m.as_dict() for m in messages],
             "stream": False,
             "options": {
                 "temperature": temperature,
@@ -187,35 +617,26 @@ class LLMService:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=self._config.timeout) as client:
-                resp = await client.post(f"{url}/api/chat", json=payload)
-                resp.raise_for_status()
-                data = resp.json()
-
-                return LLMResponse(
-                    content=data.get("message", {}).get("content", ""),
-                    model=data.get("model", self._config.model),
-                    provider="ollama",
-                    usage={
-                        "prompt_tokens": data.get("prompt_eval_count", 0),
-                        "completion_tokens": data.get("eval_count", 0),
-                    },
-                    raw_response=data,
-                )
+            data = await self._post_json(f"{url}/api/chat", payload)
+            return LLMResponse(
+                content=data.get("message", {}).get("content", ""),
+                model=data.get("model", self._config.model),
+                provider="ollama",
+                usage={
+                    "prompt_tokens": data.get("prompt_eval_count", 0),
+                    "completion_tokens": data.get("eval_count", 0),
+                },
+                raw_response=data if include_raw else None,
+            )
         except Exception as e:
             logger.error(f"Ollama API error: {e}")
             return self._mock_response(messages)
 
     async def _call_anthropic(
         self, messages: list[LLMMessage], temperature: float, max_tokens: int,
+        include_raw: bool = False,
     ) -> LLMResponse:
         """Call Anthropic Claude API."""
-        try:
-            import httpx
-        except ImportError:
-            logger.error("httpx is required for Anthropic provider")
-            return self._mock_response(messages)
-
         url = "https://api.anthropic.com/v1/messages"
         headers = {
             "Content-Type": "application/json",
@@ -230,48 +651,52 @@ class LLMService:
             if m.role == "system":
                 system_content = m.content
             else:
-                user_messages.append({"role": m.role, "content": m.content})
+                user_messages.append(m.as_dict())
 
         payload = {
             "model": self._config.model,
-            "system": system_content,
+            # cache_control lets the API reuse the prefilled system
+            # prompt across calls (it is identical every time), cutting
+            # input tokens and time-to-first-token on repeat requests
+            "system": [
+                {
+                    "type": "text",
+                    "text": system_content,
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ],
             "messages": user_messages,
             "temperature": temperature,
             "max_tokens": max_tokens,
         }
 
         try:
-            async with httpx.AsyncClient(timeout=self._config.timeout) as client:
-                resp = await client.post(url, headers=headers, json=payload)
-                resp.raise_for_status()
-                data = resp.json()
-
-                content = ""
-                for block in data.get("content", []):
-                    if block.get("type") == "text":
-                        content += block.get("text", "")
-
-                return LLMResponse(
-                    content=content,
-                    model=data.get("model", self._config.model),
-                    provider="anthropic",
-                    usage=data.get("usage", {}),
-                    raw_response=data,
+            data = await self._post_json(url, payload, headers)
+            blocks = data.get("content", [])
+            if len(blocks) == 1 and blocks[0].get("type") == "text":
+                # Overwhelmingly common case: one text block
+                content = blocks[0].get("text", "")
+            else:
+                content = "".join(
+                    b.get("text", "") for b in blocks if b.get("type") == "text"
                 )
+
+            return LLMResponse(
+                content=content,
+                model=data.get("model", self._config.model),
+                provider="anthropic",
+                usage=data.get("usage", {}),
+                raw_response=data if include_raw else None,
+            )
         except Exception as e:
             logger.error(f"Anthropic API error: {e}")
             return self._mock_response(messages)
 
     async def _call_gemini(
         self, messages: list[LLMMessage], temperature: float, max_tokens: int,
+        include_raw: bool = False,
     ) -> LLMResponse:
         """Call Google Gemini API."""
-        try:
-            import httpx
-        except ImportError:
-            logger.error("httpx is required for Gemini provider")
-            return self._mock_response(messages)
-
         url = self._config.base_url or "https://generativelanguage.googleapis.com/v1beta"
         model = self._config.model or "gemini-pro"
 
@@ -299,29 +724,25 @@ class LLMService:
             payload["systemInstruction"] = {"parts": [{"text": system_instruction}]}
 
         try:
-            async with httpx.AsyncClient(timeout=self._config.timeout) as client:
-                resp = await client.post(
-                    f"{url}/models/{model}:generateContent",
-                    headers={"x-goog-api-key": self._config.api_key or ""},
-                    json=payload,
-                )
-                resp.raise_for_status()
-                data = resp.json()
-
-                content = ""
-                candidates = data.get("candidates", [])
-                if candidates:
-                    parts = candidates[0].get("content", {}).get("parts", [])
-                    for p in parts:
-                        content += p.get("text", "")
-
-                return LLMResponse(
-                    content=content,
-                    model=model,
-                    provider="gemini",
-                    usage=data.get("usageMetadata", {}),
-                    raw_response=data,
-                )
+            data = await self._post_json(
+                f"{url}/models/{model}:generateContent",
+                payload,
+                headers={"x-goog-api-key": self._config.api_key or ""},
+            )
+            content = ""
+            candidates = data.get("candidates", [])
+            if candidates:
+                parts = candidates[0].get("content", {}).get("parts", [])
+                for p in parts:
+                    content += p.get("text", "")
+
+            return LLMResponse(
+                content=content,
+                model=model,
+                provider="gemini",
+                usage=data.get("usageMetadata", {}),
+                raw_response=data if include_raw else None,
+            )
         except Exception as e:
             logger.error(f"Gemini API error: {e}")
             return self._mock_response(messages)
@@ -347,9 +768,14 @@ class LLMService:
     # HIGH-LEVEL HELPERS FOR PIPELINE
     # =========================================================================
 
-    async def analyze_scenario(self, scenario_text: str) -> dict:
-        """Analyze a scenario text and extract structured shot list data."""
-        prompt = f"""Analyze the following film scenario and extract a structured shot list.
+    _SCENARIO_SYSTEM_PROMPT = (
+        "You are a professional film director's assistant. "
+        "Analyze scenarios and create production-ready shot lists."
+    )
+
+    @staticmethod
+    def _scenario_prompt(scenario_text: str) -> str:
+        return f"""Analyze the following film scenario and extract a structured shot list.
 For each shot, provide:
 - shot_number
 - scene_description
@@ -363,25 +789,112 @@ Scenario:
 
 Respond in JSON format as a list of shots."""
 
+    def _fit_scenario(self, scenario_text: str) -> str:
+        """Trim a scenario to the model's context window.
+
+        Overlong scripts otherwise bounce off the provider with a 400
+        after a full round trip and surface as parse_error. Trimming
+        drops whole scenes (blank-line blocks) from the end rather
+        than cutting mid-sentence.
+        """
+        model = self._config.model
+        budget = (
+            _context_limit(model) - self._config.max_tokens - _PROMPT_OVERHEAD_TOKENS
+        )
+        if _count_tokens(scenario_text, model) <= budget:
+            return scenario_text
+
+        kept = []
+        used = 0
+        for block in scenario_text.split("\n\n"):
+            block_tokens = _count_tokens(block, model) + 2
+            if used + block_tokens > budget:
+                break
+            kept.append(block)
+            used += block_tokens
+        if not kept:
+            # Single oversized block: fall back to a character cut
+            return scenario_text[: budget * 4]
+        logger.warning(
+            f"Scenario exceeds the {model} context window; "
+            f"truncated to the first {len(kept)} scene blocks"
+        )
+        return "\n\n".join(kept)
+
+    async def analyze_scenario(self, scenario_text: str) -> dict:
+        """Analyze a scenario text and extract structured shot list data."""
         response = await self.generate(
-            prompt,
-            system_prompt="You are a professional film director's assistant. "
-                         "Analyze scenarios and create production-ready shot lists.",
+            self._scenario_prompt(self._fit_scenario(scenario_text)),
+            system_prompt=self._SCENARIO_SYSTEM_PROMPT,
         )
 
         try:
-            # Try to parse JSON from response
+            # Parse the JSON array embedded in the response
             content = response.content
-            # Find JSON array in response
             start = content.find("[")
             end = content.rfind("]") + 1
             if start >= 0 and end > start:
-                return {"shots": json.loads(content[start:end]), "raw": response.content}
-        except json.JSONDecodeError:
+                return {"shots": orjson.loads(content[start:end]), "raw": response.content}
+        except orjson.JSONDecodeError:
             pass
 
         return {"shots": [], "raw": response.content, "parse_error": True}
 
+    async def analyze_scenario_stream(self, scenario_text: str) -> AsyncIterator[dict]:
+        """Yield shot dicts as the completion streams in.
+
+        With ijson installed the JSON array is parsed incrementally, so
+        the pipeline can start on shot 1 while shot N is still
+        generating. Without ijson (or a non-streaming provider) this
+        degrades to analyze_scenario and yields the shots at the end.
+        """
+        try:
+            import ijson
+        except ImportError:
+            result = await self.analyze_scenario(scenario_text)
+            for shot in result["shots"]:
+                yield shot
+            return
+
+        shots = ijson.sendable_list()
+        parser = ijson.items_coro(shots, "item")
+        started = False
+        async for chunk in self.stream(
+            self._scenario_prompt(self._fit_scenario(scenario_text)),
+            system_prompt=self._SCENARIO_SYSTEM_PROMPT,
+        ):
+            if not started:
+                # Skip any prose the model emits before the array opens
+                array_start = chunk.find("[")
+                if array_start < 0:
+                    continue
+                chunk = chunk[array_start:]
+                started = True
+            try:
+                parser.send(chunk.encode())
+            except StopIteration:
+                # Array closed; ignore trailing prose
+                for shot in shots:
+                    yield shot
+                return
+            except ijson.IncompleteJSONError:
+                # Whatever followed the bracket isn't JSON — the mock
+                # provider's "[MOCK] ..." text or bracketed prose from
+                # a real model. Yield what parsed and stop.
+                logger.warning("Scenario stream was not a JSON array; shot list truncated")
+                for shot in shots:
+                    yield shot
+                return
+            while shots:
+                yield shots.pop(0)
+        if started:
+            try:
+                parser.close()
+            except ijson.IncompleteJSONError:
+                logger.warning("Scenario stream ended mid-array; shot list truncated")
+        for shot in shots:
+            yield shot
+
     async def refine_prompt(
         self, base_prompt: str, style_reference: str = "", target_model: str = "flux"
     ) -> str:
@@ -1,14 +1,92 @@
-import json
+import copy
 import os
 import requests
 import asyncio
+from functools import lru_cache
+
+import orjson
+from requests.adapters import HTTPAdapter, Retry
 from loguru import logger
 from ..models.job import Job, JobStatus
 
+
+# 정확히 일치하는 샘플러 타입의 fast path; 커스텀 노드는 부분 문자열로 잡음
+_SAMPLER_TYPES = frozenset({"KSampler", "KSamplerAdvanced"})
+
+
+def _build_node_index(workflow: dict) -> dict:
+    """한 번의 순회로 파라미터 주입 대상 노드 ID를 수집합니다.
+
+    템플릿별로 한 번만 실행되므로 주입은 노드 전체 스캔 대신
+    O(대상 노드 수)의 직접 쓰기가 됩니다.
+    """
+    index = {"seed": [], "noise_seed": [], "text": [], "ckpt": []}
+    for node_id, node in workflow.items():
+        class_type = node.get("class_type", "")
+        inputs = node.get("inputs", {})
+
+        if (
+            class_type in _SAMPLER_TYPES
+            or "KSampler" in class_type
+            or "Seed" in class_type
+        ):
+            if "seed" in inputs:
+                index["seed"].append(node_id)
+            if "noise_seed" in inputs:
+                index["noise_seed"].append(node_id)
+
+        if class_type == "CLIPTextEncode" and isinstance(inputs.get("text"), str):
+            index["text"].append(node_id)
+
+        if class_type == "CheckpointLoaderSimple":
+            index["ckpt"].append(node_id)
+    return index
+
+
+@lru_cache(maxsize=128)
+def _load_template(path: str, mtime: float) -> tuple:
+    """Parse and index a workflow template once per (path, mtime).
+
+    같은 템플릿이 세션당 수백 번 재사용되므로 파싱 결과와 주입 인덱스를
+    함께 캐시합니다. 호출자는 반드시 deepcopy 후 사용해야 합니다
+    (주입은 in-place 변형).
+    """
+    with open(path, "rb") as f:
+        template = orjson.loads(f.read())
+    return template, _build_node_index(template)
+
 class LocalExecutor:
     def __init__(self, comfy_url="http://127.0.0.1:8188", workflow_dir="workflows"):
         self.comfy_url = comfy_url
         self.workflow_dir = workflow_dir
+        # 연결 풀링 + Keep-Alive: 작업마다 새 TCP 연결을 열지 않음
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=10,
+            max_retries=Retry(
+                total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504]
+            ),
+        )
+        self._session.mount("http://", adapter)
+        self._async_client = None  # lazy: execute_job_async 첫 호출 시 생성
+
+    def _get_async_client(self):
+        if self._async_client is None:
+            import httpx
+
+            self._async_client = httpx.AsyncClient(
+                base_url=self.comfy_url,
+                limits=httpx.Limits(max_connections=10, max_keepalive_connections=10),
+            )
+        return self._async_client
+
+    async def aclose(self):
+        """Close the pooled clients (call at app shutdown)."""
+        self._session.close()
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
 
     def execute_job(self, job: Job):
         """
@@ -18,25 +96,44 @@ class LocalExecutor:
         
         # 1. 템플릿 로드
         # workflow_type 예: "text_to_image/flux_basic"
-        template_path = os.path.join(self.workflow_dir, f"{job.workflow_type}.json")
-        if not os.path.exists(template_path):
-            logger.error(f"Workflow template not found at {template_path}")
+        loaded = self._load_workflow(job.workflow_type)
+        if loaded is None:
             return False
+        workflow, index = loaded
 
+        # 2. 파라미터 주입
+        self._inject_params(workflow, job.params, index)
+
+        # 3. Queue Prompt
         try:
-            with open(template_path, 'r', encoding='utf-8') as f:
-                workflow = json.load(f)
+            p = {"prompt": workflow, "client_id": "master_server_local"}
+            resp = self._session.post(f"{self.comfy_url}/prompt", json=p)
+            resp.raise_for_status()
+            res_json = resp.json()
+            logger.info(f"Job {job.id} queued successfully. PID: {res_json.get('prompt_id')}")
+            return True
         except Exception as e:
-            logger.error(f"Error loading template: {e}")
+            logger.error(f"Failed to queue prompt: {e}")
             return False
 
-        # 2. 파라미터 주입
-        self._inject_params(workflow, job.params)
+    async def execute_job_async(self, job: Job):
+        """
+        execute_job의 비동기 버전. 공유 AsyncClient를 사용하므로
+        스케줄러가 이벤트 루프를 막지 않고 여러 큐잉을 동시에 보낼 수 있습니다.
+        """
+        logger.info(f"Executing Job {job.id} ({job.workflow_type})...")
+
+        loaded = self._load_workflow(job.workflow_type)
+        if loaded is None:
+            return False
+        workflow, index = loaded
+
+        self._inject_params(workflow, job.params, index)
 
-        # 3. Queue Prompt
         try:
             p = {"prompt": workflow, "client_id": "master_server_local"}
-            resp = requests.post(f"{self.comfy_url}/prompt", json=p)
+            client = self._get_async_client()
+            resp = await client.post("/prompt", json=p)
             resp.raise_for_status()
             res_json = resp.json()
             logger.info(f"Job {job.id} queued successfully. PID: {res_json.get('prompt_id')}")
@@ -45,23 +142,36 @@ class LocalExecutor:
             logger.error(f"Failed to queue prompt: {e}")
             return False
 
-    def _inject_params(self, workflow, params):
-        # 간단한 파라미터 주입 로직 (Worker와 동일)
+    def _load_workflow(self, workflow_type: str):
+        """캐시된 템플릿의 작업용 사본과 주입 인덱스를 반환합니다 (실패 시 None)."""
+        template_path = os.path.join(self.workflow_dir, f"{workflow_type}.json")
+        try:
+            mtime = os.path.getmtime(template_path)
+            template, index = _load_template(template_path, mtime)
+        except OSError:
+            logger.error(f"Workflow template not found at {template_path}")
+            return None
+        except Exception as e:
+            logger.error(f"Error loading template: {e}")
+            return None
+        return copy.deepcopy(template), index
+
+    def _inject_params(self, workflow, params, index=None):
+        # 간단한 파라미터 주입 로직 (Worker와 동일) — 인덱스가 있으면
+        # 대상 노드에만 바로 쓰고, 없으면 전체 스캔으로 만들어 씁니다
+        if index is None:
+            index = _build_node_index(workflow)
+
         seed = params.get("seed", 7777777)
         prompt = params.get("prompt", "")
-        
-        for node_id, node in workflow.items():
-            class_type = node.get("class_type", "")
-            inputs = node.get("inputs", {})
-            
-            if "KSampler" in class_type or "Seed" in class_type:
-                if "seed" in inputs: inputs["seed"] = seed
-                if "noise_seed" in inputs: inputs["noise_seed"] = seed
-            
-            if class_type == "CLIPTextEncode":
-                # 긍정 프롬프트 (임시: 모든 텍스트 노드에 주입)
-                if isinstance(inputs.get("text"), str):
-                    inputs["text"] = prompt
-            
-            if class_type == "CheckpointLoaderSimple" and "ckpt_name" in params:
-                 inputs["ckpt_name"] = params["ckpt_name"]
+
+        for node_id in index["seed"]:
+            workflow[node_id]["inputs"]["seed"] = seed
+        for node_id in index["noise_seed"]:
+            workflow[node_id]["inputs"]["noise_seed"] = seed
+        for node_id in index["text"]:
+            # 긍정 프롬프트 (임시: 모든 텍스트 노드에 주입)
+            workflow[node_id]["inputs"]["text"] = prompt
+        if "ckpt_name" in params:
+            for node_id in index["ckpt"]:
+                workflow[node_id]["inputs"]["ckpt_name"] = params["ckpt_name"]
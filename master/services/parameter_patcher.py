@@ -16,8 +16,38 @@ from .workflow_parser import WorkflowParser, WorkflowAnalysis
 class ParameterPatcher:
     """Patches ComfyUI workflow JSON with dynamic parameters."""
 
+    # Analyses kept per distinct template structure; cleared wholesale
+    # if an unlikely flood of distinct templates comes through
+    ANALYSIS_CACHE_SIZE = 64
+
     def __init__(self):
         self._parser = WorkflowParser()
+        # structural key -> WorkflowAnalysis; batch rendering patches
+        # the same template hundreds of times and node roles don't
+        # change when only input values do
+        self._analysis_cache: dict = {}
+
+    @staticmethod
+    def _analysis_key(workflow_json: dict) -> tuple:
+        """Structural identity of a workflow: class types + wiring.
+
+        Scalar input values (prompts, seeds, dimensions) are excluded —
+        they are exactly what patch() rewrites — while link-valued
+        inputs are kept because prompt role tracing depends on them.
+        """
+        return tuple(sorted(
+            (
+                node_id,
+                node.get("class_type", ""),
+                tuple(sorted(
+                    (key, tuple(val))
+                    for key, val in node.get("inputs", {}).items()
+                    if isinstance(val, list)
+                )),
+            )
+            for node_id, node in workflow_json.items()
+            if isinstance(node, dict)
+        ))
 
     def patch(
         self,
@@ -39,73 +69,83 @@ class ParameterPatcher:
         Patch a workflow with runtime parameters.
         Returns the patched workflow (modifies in place).
         """
-        analysis = self._parser.analyze(workflow_json)
+        key = self._analysis_key(workflow_json)
+        analysis = self._analysis_cache.get(key)
+        if analysis is None:
+            if len(self._analysis_cache) >= self.ANALYSIS_CACHE_SIZE:
+                self._analysis_cache.clear()
+            analysis = self._parser.analyze(workflow_json)
+            self._analysis_cache[key] = analysis
 
         if analysis.errors:
             logger.warning(f"Workflow analysis errors: {analysis.errors}")
 
+        # Node ids in the analysis come from this workflow's structure,
+        # so direct indexing replaces the .get chains that allocated two
+        # throwaway dicts per absent key
+        logger_debug = logger.debug
+
         # Patch positive prompts
         if positive_prompt:
             for node_id in analysis.positive_prompt_nodes:
-                node = workflow_json.get(node_id, {})
-                inputs = node.get("inputs", {})
+                inputs = workflow_json[node_id]["inputs"]
                 if "text" in inputs:
                     inputs["text"] = positive_prompt
-                    logger.debug(f"Patched positive prompt on node {node_id}")
+                    logger_debug(f"Patched positive prompt on node {node_id}")
 
         # Patch negative prompts
         if negative_prompt:
             for node_id in analysis.negative_prompt_nodes:
-                node = workflow_json.get(node_id, {})
-                inputs = node.get("inputs", {})
+                inputs = workflow_json[node_id]["inputs"]
                 if "text" in inputs:
                     inputs["text"] = negative_prompt
-                    logger.debug(f"Patched negative prompt on node {node_id}")
-
-        # Patch sampler parameters
+                    logger_debug(f"Patched negative prompt on node {node_id}")
+
+        # Patch sampler parameters. The loop itself can't be skipped —
+        # an unspecified seed still gets randomized per render — but the
+        # scalar pairs are filtered once so the common "seed only" call
+        # doesn't re-test steps/cfg/denoise against None on every node.
+        randint = random.randint
+        scalars = tuple(
+            (key, value)
+            for key, value in (("steps", steps), ("cfg", cfg), ("denoise", denoise))
+            if value is not None
+        )
         for node_id in analysis.sampler_nodes:
-            node = workflow_json.get(node_id, {})
-            inputs = node.get("inputs", {})
+            inputs = workflow_json[node_id]["inputs"]
 
             if seed is not None:
                 inputs["seed"] = seed
             elif "seed" in inputs:
                 # Randomize seed if not specified
-                inputs["seed"] = random.randint(0, 2**32 - 1)
-
-            if steps is not None and "steps" in inputs:
-                inputs["steps"] = steps
-            if cfg is not None and "cfg" in inputs:
-                inputs["cfg"] = cfg
-            if denoise is not None and "denoise" in inputs:
-                inputs["denoise"] = denoise
-
-        # Patch dimensions (find EmptyLatentImage or similar)
-        if width is not None or height is not None:
-            for param in analysis.parameters:
-                if param.role == "width" and width:
-                    node = workflow_json.get(param.node_id, {})
-                    node.get("inputs", {})[param.param_name] = width
-                elif param.role == "height" and height:
-                    node = workflow_json.get(param.node_id, {})
-                    node.get("inputs", {})[param.param_name] = height
+                inputs["seed"] = randint(0, 2**32 - 1)
+
+            for key, value in scalars:
+                if key in inputs:
+                    inputs[key] = value
+
+        # Patch dimensions (EmptyLatentImage or similar, via role index)
+        if width:
+            for param in analysis.by_role.get("width", ()):
+                workflow_json[param.node_id]["inputs"][param.param_name] = width
+        if height:
+            for param in analysis.by_role.get("height", ()):
+                workflow_json[param.node_id]["inputs"][param.param_name] = height
 
         # Patch LoRA
         if lora_name:
             for node_id in analysis.lora_nodes:
-                node = workflow_json.get(node_id, {})
-                inputs = node.get("inputs", {})
+                inputs = workflow_json[node_id]["inputs"]
                 inputs["lora_name"] = lora_name
                 if lora_strength is not None:
                     inputs["strength_model"] = lora_strength
                     inputs["strength_clip"] = lora_strength
-                logger.debug(f"Patched LoRA on node {node_id}: {lora_name}")
+                logger_debug(f"Patched LoRA on node {node_id}: {lora_name}")
 
         # Patch filename prefix
         if filename_prefix:
             for node_id in analysis.save_nodes:
-                node = workflow_json.get(node_id, {})
-                inputs = node.get("inputs", {})
+                inputs = workflow_json[node_id]["inputs"]
                 if "filename_prefix" in inputs:
                     inputs["filename_prefix"] = filename_prefix
 
@@ -1,6 +1,7 @@
 import os
-import json
 import uuid
+
+import orjson
 from typing import List
 from loguru import logger
 from ..models.cinematic import CinematicOption
@@ -13,58 +14,66 @@ class PresetImporter:
         self.manager = data_manager
 
     def scan_and_import(self) -> int:
-        if not os.path.exists(REF_PRESETS_PATH):
+        # scandir yields DirEntry objects whose name/type checks need no
+        # extra stat() per file, unlike listdir + os.path.join probing
+        try:
+            entries = os.scandir(REF_PRESETS_PATH)
+        except FileNotFoundError:
             logger.warning(f"Preset path not found: {REF_PRESETS_PATH}")
             return 0
 
         count = 0
-        for filename in os.listdir(REF_PRESETS_PATH):
-            if not filename.endswith(".json"):
-                continue
-            
-            try:
-                filepath = os.path.join(REF_PRESETS_PATH, filename)
-                with open(filepath, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+        # One pass over existing cinematics up front; the per-file scan
+        # made the whole import O(files x cinematics)
+        existing_names = {c.name for c in self.manager.get_cinematics()}
+        with entries:
+            for entry in entries:
+                if not entry.name.endswith(".json") or not entry.is_file(follow_symlinks=False):
+                    continue
+
+                try:
+                    # orjson parses bytes directly — no text decode pass
+                    with open(entry.path, "rb") as f:
+                        data = orjson.loads(f.read())
                 
-                # Check duplication by name (simple check)
-                # Ideally check ID, but ID might overlap or be new
-                # We use name as unique identifier for our 'presets'
+                    # Check duplication by name (simple check)
+                    # Ideally check ID, but ID might overlap or be new
+                    # We use name as unique identifier for our 'presets'
                 
-                # Convert to CinematicOption
-                # JSON Structure: { "id":..., "name":..., "data": { "camera":..., ... } }
+                    # Convert to CinematicOption
+                    # JSON Structure: { "id":..., "name":..., "data": { "camera":..., ... } }
                 
-                inner_data = data.get("data", {})
+                    inner_data = data.get("data", {})
                 
-                option = CinematicOption(
-                    id=f"PRESET-{data.get('id', str(uuid.uuid4()))}", # Prefix to avoid collision
-                    name=data.get("name", filename),
-                    category="Preset",
+                    option = CinematicOption(
+                        id=f"PRESET-{data.get('id', str(uuid.uuid4()))}", # Prefix to avoid collision
+                        name=data.get("name", entry.name),
+                        category="Preset",
                     
-                    camera_body=inner_data.get("camera", "Arri Alexa"),
-                    focal_length=inner_data.get("focalLength", ""),
-                    lens_type=inner_data.get("lens", ""),
-                    film_stock=inner_data.get("filmStock", ""),
+                        camera_body=inner_data.get("camera", "Arri Alexa"),
+                        focal_length=inner_data.get("focalLength", ""),
+                        lens_type=inner_data.get("lens", ""),
+                        film_stock=inner_data.get("filmStock", ""),
                     
-                    shot_type=inner_data.get("shotType", ""),
-                    lighting=inner_data.get("lighting", ""),
+                        shot_type=inner_data.get("shotType", ""),
+                        lighting=inner_data.get("lighting", ""),
                     
-                    filters=inner_data.get("filter", []),
+                        filters=inner_data.get("filter", []),
                     
-                    raw_data=data
-                )
+                        raw_data=data
+                    )
                 
-                # Save via DataManager
-                # Check duplication by name to avoid spamming
-                existing = [c for c in self.manager.get_cinematics() if c.name == option.name]
-                if not existing:
-                    self.manager.create_cinematic(option)
-                    count += 1
-                else:
-                    # Update existing or skip? Let's skip for now to preserve user edits
-                    pass
+                    # Save via DataManager
+                    # Check duplication by name to avoid spamming
+                    if option.name not in existing_names:
+                        self.manager.create_cinematic(option)
+                        existing_names.add(option.name)
+                        count += 1
+                    else:
+                        # Update existing or skip? Let's skip for now to preserve user edits
+                        pass
                 
-            except Exception as e:
-                logger.error(f"Failed to import {filename}: {e}")
+                except Exception as e:
+                    logger.error(f"Failed to import {entry.name}: {e}")
         
         return count
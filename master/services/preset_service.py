@@ -1,82 +1,106 @@
-import json
 import os
-import glob
 from typing import List, Dict, Optional
+
+import orjson
 from loguru import logger
 from ..models.shot import TechnicalSpecs
 
 # Path to presets
 PRESETS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "ref", "nano-banana-pro", "source_dump", "dist", "presets")
 IMAGES_DIR_REL = "nano-banana-pro/source_dump/dist/images"
+IMAGES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "ref", "nano-banana-pro", "source_dump", "dist", "images")
 
 class PresetService:
     def __init__(self):
         self.presets_cache = []
-        self.load_presets()
+        self._by_id: Dict[str, Dict] = {}
+        self._image_index: Dict[str, frozenset] = {}  # category -> filenames on disk
+        # No eager load_presets() here — get_all/get_by_id load on demand
+
+    def _image_names(self, category: str) -> frozenset:
+        """Filenames under images/{category}, scanned once per category."""
+        names = self._image_index.get(category)
+        if names is None:
+            try:
+                with os.scandir(os.path.join(IMAGES_DIR, category)) as entries:
+                    names = frozenset(e.name for e in entries if e.is_file())
+            except FileNotFoundError:
+                names = frozenset()
+            self._image_index[category] = names
+        return names
 
     def load_presets(self):
         """Loads all JSON presets and maps images."""
         loaded = []
-        if not os.path.exists(PRESETS_DIR):
+        loaded_by_id = {}  # id -> preset; O(1) duplicate check
+        # scandir streams DirEntry objects instead of materializing the
+        # glob list, and the suffix/is_file checks need no extra stat()
+        try:
+            entries = os.scandir(PRESETS_DIR)
+        except FileNotFoundError:
             logger.warning(f"Presets dir not found: {PRESETS_DIR}")
             return
 
-        json_files = glob.glob(os.path.join(PRESETS_DIR, "*.json"))
-        
-        for fpath in json_files:
-            try:
-                with open(fpath, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+        with entries:
+            for entry in entries:
+                if not entry.name.endswith('.json') or not entry.is_file():
+                    continue
+                try:
+                    # orjson parses bytes directly — no text decode pass
+                    with open(entry.path, 'rb') as f:
+                        data = orjson.loads(f.read())
                     
-                # Normalize Data
-                p_data = data.get("data", {})
+                    # Normalize Data
+                    p_data = data.get("data", {})
                 
-                # Image Mapping Logic
-                # Camera: "s16mm film camera" -> "s16mm-film-camera.jpg"
-                camera_img = self._find_image("cameras", p_data.get("camera", ""))
-                lens_img = self._find_image("lenses", p_data.get("lens", ""))
+                    # Image Mapping Logic
+                    # Camera: "s16mm film camera" -> "s16mm-film-camera.jpg"
+                    camera_img = self._find_image("cameras", p_data.get("camera", ""))
+                    lens_img = self._find_image("lenses", p_data.get("lens", ""))
                 
-                # Fallback to general preset layout image if available? 
-                # For now just use camera as thumbnail
+                    # Fallback to general preset layout image if available? 
+                    # For now just use camera as thumbnail
                 
-                # Check for duplicates by ID
-                existing = next((x for x in loaded if x["id"] == data.get("id")), None)
-                if not existing:
-                    preset = {
-                        "id": data.get("id"),
-                        "name": data.get("name"),
-                        "technical": {
-                            "camera": p_data.get("camera"),
-                            "film_stock": p_data.get("filmStock"),
-                            "lens": p_data.get("lens"),
-                            "lighting": p_data.get("lighting"),
-                            "aspect_ratio": p_data.get("aspectRatio"),
-                            "filter": p_data.get("filter", [])
-                        },
-                        "images": {
-                            "camera": camera_img,
-                            "lens": lens_img
+                    # Check for duplicates by ID
+                    pid = data.get("id")
+                    if pid not in loaded_by_id:
+                        preset = {
+                            "id": pid,
+                            "name": data.get("name"),
+                            "technical": {
+                                "camera": p_data.get("camera"),
+                                "film_stock": p_data.get("filmStock"),
+                                "lens": p_data.get("lens"),
+                                "lighting": p_data.get("lighting"),
+                                "aspect_ratio": p_data.get("aspectRatio"),
+                                "filter": p_data.get("filter", [])
+                            },
+                            "images": {
+                                "camera": camera_img,
+                                "lens": lens_img
+                            }
                         }
-                    }
-                    loaded.append(preset)
-            except Exception as e:
-                logger.error(f"Failed to load preset {fpath}: {e}")
+                        loaded_by_id[pid] = preset
+                        loaded.append(preset)
+                except Exception as e:
+                    logger.error(f"Failed to load preset {entry.path}: {e}")
                 
         self.presets_cache = loaded
+        self._by_id = loaded_by_id
 
     def _find_image(self, category: str, name: str) -> Optional[str]:
         if not name: return None
-        
+
         # Slugify: "Arri Alexa" -> "arri-alexa"
         slug = name.lower().replace(" ", "-")
-        
-        # Construct URL path (served via StaticFiles /ref)
-        # Check existence? We assume structure matches.
-        # Path: /ref/nano-banana-pro/source_dump/dist/images/{category}/{slug}.jpg
-        
-        # Local check could be done here if needed, but we'll return the URL path.
-        img_url = f"/ref/{IMAGES_DIR_REL}/{category}/{slug}.jpg"
-        return img_url
+
+        # Only return a URL for files that actually exist on disk;
+        # the index avoids a stat() per preset field on every load
+        if f"{slug}.jpg" not in self._image_names(category):
+            return None
+
+        # URL path (served via StaticFiles /ref)
+        return f"/ref/{IMAGES_DIR_REL}/{category}/{slug}.jpg"
 
     def get_all(self) -> List[Dict]:
         if not self.presets_cache:
@@ -84,10 +108,20 @@ class PresetService:
         return self.presets_cache
 
     def get_by_id(self, pid: str) -> Optional[Dict]:
-        for p in self.presets_cache:
-            if p["id"] == pid:
-                return p
-        return None
+        if not self.presets_cache:
+            self.load_presets()
+        return self._by_id.get(pid)
+
+class _LazyPresetService:
+    """Import-time placeholder — defers construction (and the preset
+    directory scan behind it) until the first attribute access."""
+    _instance: Optional[PresetService] = None
+
+    def __getattr__(self, name):
+        if _LazyPresetService._instance is None:
+            _LazyPresetService._instance = PresetService()
+        return getattr(_LazyPresetService._instance, name)
+
 
-# Singleton
-preset_service = PresetService()
+# Singleton — resolved lazily so importing this module costs no disk I/O
+preset_service = _LazyPresetService()
@@ -1,9 +1,37 @@
+from functools import lru_cache
 from typing import List, Optional
 from ..models.shot import Shot
 from ..models.character import Character
 from ..models.cinematic import CinematicOption
 
 class PromptEngine:
+    # (field, format) pairs for the technical suffix, in output order
+    _TECH_FORMATS = (
+        ("camera", "shot on {}"),
+        ("film_stock", "{}, film grain"),
+        ("lens", "{} lens"),
+    )
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _tech_suffix_renderer(shape: tuple):
+        """
+        Returns a suffix builder specialized for one shape of TechnicalSpecs.
+        Shots in a batch almost always share which technical fields are set,
+        so the per-field if-chain is resolved once per shape and cached;
+        the returned callable only formats the values.
+        """
+        pairs = tuple((f, fmt) for f, fmt in PromptEngine._TECH_FORMATS if f in shape)
+        has_filter = "filter" in shape
+
+        def render(tech) -> str:
+            details = [fmt.format(getattr(tech, field)) for field, fmt in pairs]
+            if has_filter:
+                details.extend(tech.filter)
+            return ", ".join(details)
+
+        return render
+
     @staticmethod
     def assemble_prompt(shot: Shot, characters: List[Character]) -> str:
         """
@@ -71,31 +99,34 @@ class PromptEngine:
         if env_parts:
             parts.append(", ".join(env_parts))
             
-        # 4. Technical Details (Suffix)
-        tech_details = []
-        if tech.camera: tech_details.append(f"shot on {tech.camera}")
-        if tech.film_stock: tech_details.append(f"{tech.film_stock}, film grain")
-        if tech.lens: tech_details.append(f"{tech.lens} lens")
-        if tech.filter: tech_details.extend(tech.filter)
-        
-        if tech_details:
-            parts.append(", ".join(tech_details))
+        # 4. Technical Details (Suffix) — via shape-specialized renderer
+        if tech:
+            shape = tuple(
+                f for f in ("camera", "film_stock", "lens", "filter")
+                if getattr(tech, f, None)
+            )
+            if shape:
+                parts.append(PromptEngine._tech_suffix_renderer(shape)(tech))
 
         # 5. LoRA Triggers (Auto-append)
-        triggers = []
+        # dict preserves insertion order, so dedupe keeps triggers
+        # deterministic across runs (set ordering varied per process)
+        triggers = {}
         for char in characters:
             if char.use_lora and char.trigger_words:
-                triggers.extend([w.strip() for w in char.trigger_words.split(",") if w.strip()])
-        
+                triggers.update(
+                    dict.fromkeys(w.strip() for w in char.trigger_words.split(",") if w.strip())
+                )
+
         if triggers:
-            parts.append(", ".join(list(set(triggers))))
+            parts.append(", ".join(triggers))
 
         # 6. Aspect Ratio (Optional, usually handled by params but good to have in prompt for some models)
         # if tech.aspect_ratio: parts.append(f"--ar {tech.aspect_ratio}")
 
-        # Assemble
-        full_prompt = ", ".join(parts)
-        return full_prompt
+        # Assemble — empty fragments are filtered here so no " ,"/",,"
+        # cleanup pass over the final string is ever needed
+        return ", ".join(p for p in parts if p)
 
     @staticmethod
     def get_lora_config(characters: List[Character]) -> List[dict]:
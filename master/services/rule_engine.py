@@ -7,6 +7,8 @@ Adapted from DirectorsConsole's rule engine with our pipeline-specific additions
 - VRAM requirement tagging per workflow
 """
 
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Callable, Optional
 
 from ..models.cinema_enums import (
@@ -43,7 +45,7 @@ from ..utils import logger
 # CAMERA CLASSIFICATION SETS
 # =============================================================================
 
-FILM_CAMERA_BODIES = {
+FILM_CAMERA_BODIES = frozenset({
     CameraBody.ARRICAM_ST, CameraBody.ARRICAM_LT, CameraBody.ARRI_535B,
     CameraBody.ARRI_35BL, CameraBody.ARRI_35_III, CameraBody.ARRIFLEX_35,
     CameraBody.ARRIFLEX_35BL, CameraBody.ARRIFLEX_435,
@@ -55,99 +57,118 @@ FILM_CAMERA_BODIES = {
     CameraBody.MITCHELL_BNC, CameraBody.MITCHELL_BNCR, CameraBody.MITCHELL_BFC_65,
     CameraBody.IMAX_MSM_9802, CameraBody.IMAX_MKIV, CameraBody.IMAX_GT_BODY,
     CameraBody.ECLAIR_NPR, CameraBody.UFA_CUSTOM, CameraBody.PATHE_STUDIO,
-}
+})
 
-PANAVISION_CAMERA_BODIES = {
+PANAVISION_CAMERA_BODIES = frozenset({
     CameraBody.PANAVISION_MILLENNIUM_XL2, CameraBody.PANAVISION_MILLENNIUM,
     CameraBody.PANAVISION_PLATINUM, CameraBody.PANAVISION_GOLD,
     CameraBody.PANAVISION_PANASTAR, CameraBody.PANAVISION_PANAFLEX,
     CameraBody.SUPER_PANAVISION_70, CameraBody.ULTRA_PANAVISION_70,
     CameraBody.PANAVISION_XL,
-}
+})
 
-PANAVISION_LENS_FAMILIES = {
+PANAVISION_LENS_FAMILIES = frozenset({
     LensFamily.PANAVISION_PRIMO, LensFamily.PANAVISION_PRIMO_70,
     LensFamily.PANAVISION_ANAMORPHIC, LensFamily.PANAVISION_C_SERIES,
     LensFamily.PANAVISION_E_SERIES, LensFamily.PANAVISION_SPHERO,
     LensFamily.PANAVISION_ULTRA_SPEED,
-}
+})
 
-LARGE_FORMAT_CAMERAS = {
+LARGE_FORMAT_CAMERAS = frozenset({
     CameraBody.ALEXA_65, CameraBody.ALEXA_LF, CameraBody.ALEXA_MINI_LF,
     CameraBody.SUPER_PANAVISION_70, CameraBody.ULTRA_PANAVISION_70,
     CameraBody.MITCHELL_BFC_65,
     CameraBody.IMAX_MSM_9802, CameraBody.IMAX_MKIV, CameraBody.IMAX_GT_BODY,
-}
+})
 
-IMAX_CAMERAS = {
+IMAX_CAMERAS = frozenset({
     CameraBody.IMAX_MSM_9802, CameraBody.IMAX_MKIV, CameraBody.IMAX_GT_BODY,
-}
+})
 
-HEAVY_CAMERAS = {
+HEAVY_CAMERAS = frozenset({
     CameraBody.ALEXA_65, CameraBody.VENICE_2, CameraBody.C700_FF,
     CameraBody.ARRICAM_ST, CameraBody.ARRI_535B,
     CameraBody.PANAVISION_PLATINUM, CameraBody.PANAVISION_GOLD,
     CameraBody.MITCHELL_BNC, CameraBody.MITCHELL_BNCR, CameraBody.MITCHELL_BFC_65,
     CameraBody.SUPER_PANAVISION_70, CameraBody.ULTRA_PANAVISION_70,
     CameraBody.IMAX_MSM_9802, CameraBody.IMAX_GT_BODY,
-}
+})
 
-MEDIUM_CAMERAS = {
+MEDIUM_CAMERAS = frozenset({
     CameraBody.ALEXA_35, CameraBody.V_RAPTOR_XL,
     CameraBody.ARRICAM_LT, CameraBody.ARRI_35BL, CameraBody.ARRI_35_III,
     CameraBody.PANAVISION_MILLENNIUM_XL2, CameraBody.PANAVISION_MILLENNIUM,
     CameraBody.PANAVISION_PANAFLEX, CameraBody.PANAVISION_PANASTAR,
     CameraBody.IMAX_MKIV,
-}
+})
 
-LIGHT_CAMERAS = {
+LIGHT_CAMERAS = frozenset({
     CameraBody.ALEXA_MINI, CameraBody.ALEXA_MINI_LF, CameraBody.ALEXA_LF,
     CameraBody.V_RAPTOR, CameraBody.V_RAPTOR_X, CameraBody.KOMODO_X,
     CameraBody.FX6, CameraBody.FX9, CameraBody.POCKET_6K,
     CameraBody.Z9, CameraBody.S1H, CameraBody.MAVIC_3_CINE,
-}
+})
 
-S35_ONLY_LENSES = {
+S35_ONLY_LENSES = frozenset({
     LensFamily.ARRI_ULTRA_PRIME, LensFamily.ARRI_MASTER_PRIME,
     LensFamily.ZEISS_MASTER_PRIME, LensFamily.COOKE_S4,
     LensFamily.PANAVISION_PRIMO,
-}
+})
 
-HIGH_RES_CAMERAS = {
+HIGH_RES_CAMERAS = frozenset({
     CameraBody.V_RAPTOR, CameraBody.V_RAPTOR_X, CameraBody.V_RAPTOR_XL,
-}
+})
 
 
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
 
+# Flattened from the HEAVY/MEDIUM/LIGHT sets so classification is a
+# single dict lookup instead of up to three set probes per rule check
+_WEIGHT_CLASS_MAP: dict[CameraBody, WeightClass] = {
+    **dict.fromkeys(HEAVY_CAMERAS, WeightClass.HEAVY),
+    **dict.fromkeys(MEDIUM_CAMERAS, WeightClass.MEDIUM),
+    **dict.fromkeys(LIGHT_CAMERAS, WeightClass.LIGHT),
+}
+
+
 def _get_weight_class(body: CameraBody) -> WeightClass:
     """Get weight class for a camera body."""
-    if body in HEAVY_CAMERAS:
-        return WeightClass.HEAVY
-    elif body in MEDIUM_CAMERAS:
-        return WeightClass.MEDIUM
-    elif body in LIGHT_CAMERAS:
-        return WeightClass.LIGHT
-    return WeightClass.ULTRA_LIGHT
+    return _WEIGHT_CLASS_MAP.get(body, WeightClass.ULTRA_LIGHT)
 
 
 def _is_film_camera(body: CameraBody) -> bool:
     return body in FILM_CAMERA_BODIES
 
 
+# Equipment a HEAVY-class camera can never be mounted on
+_HEAVY_FORBIDDEN_EQUIP = frozenset({
+    MovementEquipment.HANDHELD, MovementEquipment.GIMBAL, MovementEquipment.DRONE,
+})
+
+# Lighting source -> year the technology became available
+_LIGHTING_SOURCE_INTRO_YEAR = {
+    LightingSource.HMI: 1972,       # invented 1972
+    LightingSource.KINO_FLO: 1987,  # company founded 1987
+    LightingSource.LED: 2002,       # film LED lighting ~2002
+}
+
+# Decade label -> representative mid-decade year
+_DECADE_MAP = {
+    "1890s": 1895, "1900s": 1905, "1910s": 1915, "1920s": 1925,
+    "1930s": 1935, "1940s": 1945, "1950s": 1955, "1960s": 1965,
+    "1970s": 1975, "1980s": 1985, "1990s": 1995, "2000s": 2005,
+    "2010s": 2015, "2020s": 2025,
+}
+
+
+@lru_cache(maxsize=512)
 def _era_before_year(era: str, year: int) -> bool:
     """Check if an era string represents a time before the given year."""
-    era_lower = era.lower()
-    decade_map = {
-        "1890s": 1895, "1900s": 1905, "1910s": 1915, "1920s": 1925,
-        "1930s": 1935, "1940s": 1945, "1950s": 1955, "1960s": 1965,
-        "1970s": 1975, "1980s": 1985, "1990s": 1995, "2000s": 2005,
-        "2010s": 2015, "2020s": 2025,
-    }
-    if era_lower in decade_map:
-        return decade_map[era_lower] < year
+    decade = _DECADE_MAP.get(era.lower())
+    if decade is not None:
+        return decade < year
     # Try parsing as a year
     try:
         return int(era) < year
@@ -159,12 +180,38 @@ def _era_before_year(era: str, year: int) -> bool:
 # RULE CLASS
 # =============================================================================
 
-CheckFunc = Callable[[Any], bool]
+@dataclass(slots=True)
+class ShotContext:
+    """Derived values shared by many rules, computed once per shot.
+
+    Weight class, film/IMAX membership etc. were re-derived inside each
+    rule lambda; with 30+ rules per shot that repeated the same set
+    probes dozens of times per validation.
+    """
+    weight_class: WeightClass
+    is_film: bool
+    is_imax: bool
+    era: str | None = None
+
+    @classmethod
+    def from_config(cls, config: Any) -> "ShotContext":
+        body = config.camera.body
+        return cls(
+            weight_class=_get_weight_class(body),
+            is_film=body in FILM_CAMERA_BODIES,
+            is_imax=body in IMAX_CAMERAS,
+            era=getattr(config, "era", None),
+        )
+
+
+CheckFunc = Callable[[Any, ShotContext], bool]
 
 
 class Rule:
     """A validation rule with condition check."""
 
+    __slots__ = ("rule_id", "severity", "message", "check", "field_path")
+
     def __init__(
         self,
         rule_id: str,
@@ -179,19 +226,25 @@ class Rule:
         self.check = check
         self.field_path = field_path
 
-    def evaluate(self, config: Any) -> ValidationMessage | None:
+    def evaluate(self, config: Any, ctx: ShotContext | None = None) -> ValidationMessage | None:
         """Returns message if rule is VIOLATED."""
         try:
-            if self.check(config):
+            # Callers using the original evaluate(config) form get the
+            # context derived here; a None ctx must never reach checks
+            # or their AttributeError would read as "rule passed"
+            if ctx is None:
+                ctx = ShotContext.from_config(config)
+            if self.check(config, ctx):
                 return ValidationMessage(
                     rule_id=self.rule_id,
                     severity=self.severity,
                     message=self.message,
                     field_path=self.field_path,
                 )
-        except Exception:
-            # Don't crash on rule evaluation errors
-            pass
+        except (AttributeError, TypeError, KeyError) as e:
+            # Schema mismatch between rule and config — don't crash,
+            # but don't swallow it invisibly either
+            logger.debug(f"Rule {self.rule_id} skipped: {e}")
         return None
 
 
@@ -206,8 +259,8 @@ LIVE_ACTION_RULES: list[Rule] = [
         severity=RuleSeverity.HARD,
         message="Film stock cannot be selected with digital cameras.",
         field_path="camera.film_stock",
-        check=lambda c: (
-            not _is_film_camera(c.camera.body) and
+        check=lambda c, ctx: (
+            not ctx.is_film and
             c.camera.film_stock != FilmStock.NONE
         ),
     ),
@@ -216,8 +269,8 @@ LIVE_ACTION_RULES: list[Rule] = [
         severity=RuleSeverity.HARD,
         message="Film cameras require a film stock selection.",
         field_path="camera.film_stock",
-        check=lambda c: (
-            _is_film_camera(c.camera.body) and
+        check=lambda c, ctx: (
+            ctx.is_film and
             c.camera.film_stock == FilmStock.NONE
         ),
     ),
@@ -226,7 +279,7 @@ LIVE_ACTION_RULES: list[Rule] = [
         severity=RuleSeverity.HARD,
         message="65mm/70mm film stocks require large format (65mm) cameras.",
         field_path="camera.film_stock",
-        check=lambda c: (
+        check=lambda c, ctx: (
             c.camera.film_stock in {
                 FilmStock.KODAK_65MM_500T, FilmStock.KODAK_65MM_250D,
                 FilmStock.KODAK_65MM_200T,
@@ -238,9 +291,9 @@ LIVE_ACTION_RULES: list[Rule] = [
         severity=RuleSeverity.HARD,
         message="IMAX film stocks require IMAX cameras.",
         field_path="camera.film_stock",
-        check=lambda c: (
+        check=lambda c, ctx: (
             c.camera.film_stock in {FilmStock.IMAX_500T, FilmStock.IMAX_250D} and
-            c.camera.body not in IMAX_CAMERAS
+            not ctx.is_imax
         ),
     ),
 
@@ -250,7 +303,7 @@ LIVE_ACTION_RULES: list[Rule] = [
         severity=RuleSeverity.HARD,
         message="Ultra Panavision 70 cameras use 2.76:1 anamorphic aspect ratio.",
         field_path="camera.aspect_ratio",
-        check=lambda c: (
+        check=lambda c, ctx: (
             c.camera.body == CameraBody.ULTRA_PANAVISION_70 and
             c.camera.aspect_ratio != AspectRatio.RATIO_2_76
         ),
@@ -260,7 +313,7 @@ LIVE_ACTION_RULES: list[Rule] = [
         severity=RuleSeverity.WARNING,
         message="IMAX 15/70 cameras typically use 1.43:1 aspect ratio.",
         field_path="camera.aspect_ratio",
-        check=lambda c: (
+        check=lambda c, ctx: (
             c.camera.body in {CameraBody.IMAX_MSM_9802, CameraBody.IMAX_GT_BODY} and
             c.camera.aspect_ratio not in {AspectRatio.RATIO_1_43, AspectRatio.RATIO_1_90}
         ),
@@ -270,7 +323,7 @@ LIVE_ACTION_RULES: list[Rule] = [
         severity=RuleSeverity.HARD,
         message="2.76:1 aspect ratio requires Ultra Panavision 70 camera system.",
         field_path="camera.aspect_ratio",
-        check=lambda c: (
+        check=lambda c, ctx: (
             c.camera.aspect_ratio == AspectRatio.RATIO_2_76 and
             c.camera.body != CameraBody.ULTRA_PANAVISION_70
         ),
@@ -282,7 +335,7 @@ LIVE_ACTION_RULES: list[Rule] = [
         severity=RuleSeverity.HARD,
         message="Panavision cameras use proprietary mount. Only Panavision lenses are compatible.",
         field_path="lens.family",
-        check=lambda c: (
+        check=lambda c, ctx: (
             c.camera.body in PANAVISION_CAMERA_BODIES and
             c.lens.family not in PANAVISION_LENS_FAMILIES
         ),
@@ -292,7 +345,7 @@ LIVE_ACTION_RULES: list[Rule] = [
         severity=RuleSeverity.HARD,
         message="Panavision lenses require Panavision mount cameras.",
         field_path="lens.family",
-        check=lambda c: (
+        check=lambda c, ctx: (
             c.lens.family in PANAVISION_LENS_FAMILIES and
             c.camera.body not in PANAVISION_CAMERA_BODIES and
             c.camera.body != CameraBody.ALEXA_65
@@ -303,7 +356,7 @@ LIVE_ACTION_RULES: list[Rule] = [
         severity=RuleSeverity.HARD,
         message="Alexa 65 (XPL mount, 65mm sensor) requires 65mm format lenses.",
         field_path="lens.family",
-        check=lambda c: (
+        check=lambda c, ctx: (
             c.camera.body == CameraBody.ALEXA_65 and
             c.lens.family not in {
                 LensFamily.ARRI_PRIME_65, LensFamily.ARRI_PRIME_DNA,
@@ -317,7 +370,7 @@ LIVE_ACTION_RULES: list[Rule] = [
         severity=RuleSeverity.HARD,
         message="Large Format cameras require LF/FF lenses. S35-only lenses will vignette.",
         field_path="lens.family",
-        check=lambda c: (
+        check=lambda c, ctx: (
             c.camera.body in {CameraBody.ALEXA_LF, CameraBody.ALEXA_MINI_LF} and
             c.lens.family in S35_ONLY_LENSES
         ),
@@ -329,7 +382,7 @@ LIVE_ACTION_RULES: list[Rule] = [
         severity=RuleSeverity.HARD,
         message="Sunlight is not available at night.",
         field_path="lighting.source",
-        check=lambda c: (
+        check=lambda c, ctx: (
             c.lighting.time_of_day == TimeOfDay.NIGHT and
             c.lighting.source == LightingSource.SUN
         ),
@@ -339,7 +392,7 @@ LIVE_ACTION_RULES: list[Rule] = [
         severity=RuleSeverity.HARD,
         message="Direct sunlight is not available during blue hour.",
         field_path="lighting.source",
-        check=lambda c: (
+        check=lambda c, ctx: (
             c.lighting.time_of_day == TimeOfDay.BLUE_HOUR and
             c.lighting.source == LightingSource.SUN
         ),
@@ -349,7 +402,7 @@ LIVE_ACTION_RULES: list[Rule] = [
         severity=RuleSeverity.HARD,
         message="Low-key lighting is nearly impossible at midday without extensive control.",
         field_path="lighting.style",
-        check=lambda c: (
+        check=lambda c, ctx: (
             c.lighting.time_of_day == TimeOfDay.MIDDAY and
             c.lighting.style == LightingStyle.LOW_KEY
         ),
@@ -359,76 +412,36 @@ LIVE_ACTION_RULES: list[Rule] = [
         severity=RuleSeverity.HARD,
         message="Moonlight cannot be key light during midday.",
         field_path="lighting.source",
-        check=lambda c: (
+        check=lambda c, ctx: (
             c.lighting.time_of_day == TimeOfDay.MIDDAY and
             c.lighting.source == LightingSource.MOON
         ),
     ),
 
     # --- ERA ANACHRONISM ---
+    # One rule with an intro-year table instead of one rule per source
     Rule(
-        rule_id="LA_ERA_HMI_ANACHRONISM",
-        severity=RuleSeverity.HARD,
-        message="HMI lighting was invented in 1972. Not available for earlier eras.",
-        field_path="lighting.source",
-        check=lambda c: (
-            c.era is not None and
-            _era_before_year(c.era, 1972) and
-            c.lighting.source == LightingSource.HMI
-        ),
-    ),
-    Rule(
-        rule_id="LA_ERA_KINO_ANACHRONISM",
+        rule_id="LA_ERA_LIGHTING_ANACHRONISM",
         severity=RuleSeverity.HARD,
-        message="Kino Flo was founded in 1987. Not available for earlier eras.",
+        message="Lighting source postdates the selected era (HMI: 1972, Kino Flo: 1987, LED: 2002).",
         field_path="lighting.source",
-        check=lambda c: (
-            c.era is not None and
-            _era_before_year(c.era, 1987) and
-            c.lighting.source == LightingSource.KINO_FLO
-        ),
-    ),
-    Rule(
-        rule_id="LA_ERA_LED_ANACHRONISM",
-        severity=RuleSeverity.HARD,
-        message="LED film lighting became available around 2002.",
-        field_path="lighting.source",
-        check=lambda c: (
-            c.era is not None and
-            _era_before_year(c.era, 2002) and
-            c.lighting.source == LightingSource.LED
+        check=lambda c, ctx: (
+            ctx.era is not None and
+            c.lighting.source in _LIGHTING_SOURCE_INTRO_YEAR and
+            _era_before_year(ctx.era, _LIGHTING_SOURCE_INTRO_YEAR[c.lighting.source])
         ),
     ),
 
     # --- MOVEMENT CONSTRAINTS ---
+    # Fused from three rules sharing the same HEAVY antecedent
     Rule(
-        rule_id="LA_HEAVY_NO_HANDHELD",
+        rule_id="LA_HEAVY_EQUIP_LIMIT",
         severity=RuleSeverity.HARD,
-        message="Heavy cameras (>4kg) cannot be operated handheld safely.",
+        message="Heavy cameras (>4kg) cannot be operated handheld or mounted on gimbals/drones.",
         field_path="movement.equipment",
-        check=lambda c: (
-            _get_weight_class(c.camera.body) == WeightClass.HEAVY and
-            c.movement.equipment == MovementEquipment.HANDHELD
-        ),
-    ),
-    Rule(
-        rule_id="LA_HEAVY_NO_GIMBAL",
-        severity=RuleSeverity.HARD,
-        message="Heavy cameras (>4kg) exceed gimbal payload limits.",
-        field_path="movement.equipment",
-        check=lambda c: (
-            _get_weight_class(c.camera.body) == WeightClass.HEAVY and
-            c.movement.equipment == MovementEquipment.GIMBAL
-        ),
-    ),
-    Rule(
-        rule_id="LA_HEAVY_NO_DRONE",
-        severity=RuleSeverity.HARD,
-        message="Heavy cameras (>4kg) exceed standard drone payload limits.",
-        field_path="movement.equipment",
-        check=lambda c: (
-            _get_weight_class(c.camera.body) == WeightClass.HEAVY and
-            c.movement.equipment == MovementEquipment.DRONE
+        check=lambda c, ctx: (
+            ctx.weight_class == WeightClass.HEAVY and
+            c.movement.equipment in _HEAVY_FORBIDDEN_EQUIP
         ),
     ),
     Rule(
@@ -436,7 +449,7 @@ LIVE_ACTION_RULES: list[Rule] = [
         severity=RuleSeverity.HARD,
         message="Jib equipment can only perform Crane_Up, Crane_Down, and Arc movements.",
         field_path="movement.movement_type",
-        check=lambda c: (
+        check=lambda c, ctx: (
             c.movement.equipment == MovementEquipment.JIB and
             c.movement.movement_type not in {
                 MovementType.CRANE_UP, MovementType.CRANE_DOWN,
@@ -449,7 +462,7 @@ LIVE_ACTION_RULES: list[Rule] = [
         severity=RuleSeverity.HARD,
         message="Dolly zoom (Vertigo effect) requires dolly or slider equipment.",
         field_path="movement.equipment",
-        check=lambda c: (
+        check=lambda c, ctx: (
             c.movement.movement_type == MovementType.DOLLY_ZOOM and
             c.movement.equipment not in {
                 MovementEquipment.DOLLY, MovementEquipment.SLIDER,
@@ -463,8 +476,8 @@ LIVE_ACTION_RULES: list[Rule] = [
         severity=RuleSeverity.WARNING,
         message="Medium-weight cameras (3-4kg) may cause operator fatigue during extended handheld work.",
         field_path="movement.equipment",
-        check=lambda c: (
-            _get_weight_class(c.camera.body) == WeightClass.MEDIUM and
+        check=lambda c, ctx: (
+            ctx.weight_class == WeightClass.MEDIUM and
             c.movement.equipment == MovementEquipment.HANDHELD
         ),
     ),
@@ -473,7 +486,7 @@ LIVE_ACTION_RULES: list[Rule] = [
         severity=RuleSeverity.WARNING,
         message="Wide angle lens (<35mm) on close-up causes facial distortion. Intentional?",
         field_path="lens.focal_length_mm",
-        check=lambda c: (
+        check=lambda c, ctx: (
             c.lens.focal_length_mm < 35 and
             c.visual_grammar.shot_size.value in {"CU", "BCU", "ECU"}
         ),
@@ -483,7 +496,7 @@ LIVE_ACTION_RULES: list[Rule] = [
         severity=RuleSeverity.WARNING,
         message="Long lens (>85mm) on wide shot creates strong compression. Unusual choice.",
         field_path="lens.focal_length_mm",
-        check=lambda c: (
+        check=lambda c, ctx: (
             c.lens.focal_length_mm > 85 and
             c.visual_grammar.shot_size.value in {"EWS", "WS"}
         ),
@@ -493,7 +506,7 @@ LIVE_ACTION_RULES: list[Rule] = [
         severity=RuleSeverity.WARNING,
         message="Vintage lenses may not resolve well on 8K+ sensors.",
         field_path="lens.family",
-        check=lambda c: (
+        check=lambda c, ctx: (
             c.lens.family in {LensFamily.VINTAGE_ANAMORPHIC, LensFamily.VINTAGE_SPHERICAL} and
             c.camera.body in HIGH_RES_CAMERAS
         ),
@@ -503,7 +516,7 @@ LIVE_ACTION_RULES: list[Rule] = [
         severity=RuleSeverity.WARNING,
         message="Cheerful mood with low-key lighting is atypical. Intentional subversion?",
         field_path="lighting.style",
-        check=lambda c: (
+        check=lambda c, ctx: (
             c.visual_grammar.mood == Mood.CHEERFUL and
             c.lighting.style == LightingStyle.LOW_KEY
         ),
@@ -513,7 +526,7 @@ LIVE_ACTION_RULES: list[Rule] = [
         severity=RuleSeverity.WARNING,
         message="Dolly zoom at fast timing is disorienting. Typically done at slow/moderate pace.",
         field_path="movement.timing",
-        check=lambda c: (
+        check=lambda c, ctx: (
             c.movement.movement_type == MovementType.DOLLY_ZOOM and
             c.movement.timing in {MovementTiming.FAST, MovementTiming.WHIP_FAST}
         ),
@@ -525,7 +538,7 @@ LIVE_ACTION_RULES: list[Rule] = [
         severity=RuleSeverity.WARNING,
         message="Symmetrical composition is unusual for ECU.",
         field_path="visual_grammar.composition",
-        check=lambda c: (
+        check=lambda c, ctx: (
             c.visual_grammar.composition == Composition.SYMMETRICAL and
             c.visual_grammar.shot_size == ShotSize.ECU
         ),
@@ -535,7 +548,7 @@ LIVE_ACTION_RULES: list[Rule] = [
         severity=RuleSeverity.WARNING,
         message="Fill The Frame composition contradicts Wide Shot framing.",
         field_path="visual_grammar.composition",
-        check=lambda c: (
+        check=lambda c, ctx: (
             c.visual_grammar.composition == Composition.FILL_THE_FRAME and
             c.visual_grammar.shot_size in {ShotSize.WS, ShotSize.EWS, ShotSize.MWS}
         ),
@@ -547,7 +560,7 @@ LIVE_ACTION_RULES: list[Rule] = [
         severity=RuleSeverity.INFO,
         message="Anamorphic lens selected. Set 2x de-squeeze in post for proper aspect ratio.",
         field_path="lens.is_anamorphic",
-        check=lambda c: c.lens.is_anamorphic is True,
+        check=lambda c, ctx: c.lens.is_anamorphic is True,
     ),
 ]
 
@@ -773,18 +786,49 @@ class RuleEngine:
     def __init__(self):
         self._live_action_rules = LIVE_ACTION_RULES
         self._animation_rules: list[Rule] = []  # Animation rules can be added later
+        # Bucket rules by the top-level field of their field_path so
+        # validation can skip whole groups a config doesn't carry.
+        # Rules without a field_path land in the always-run "" bucket.
+        self._rules_by_trigger: dict[str, list[Rule]] = {}
+        for rule in self._live_action_rules:
+            group = rule.field_path.split(".", 1)[0] if rule.field_path else ""
+            self._rules_by_trigger.setdefault(group, []).append(rule)
+        # Flattened (check, rule) pairs per group: the hot loop calls
+        # the predicate directly, saving one Rule.evaluate frame per
+        # rule per shot (N shots x R rules adds up in batch validation)
+        self._checks_by_trigger: dict[str, list[tuple[CheckFunc, Rule]]] = {
+            group: [(rule.check, rule) for rule in rules]
+            for group, rules in self._rules_by_trigger.items()
+        }
         logger.info(
-            f"RuleEngine initialized: {len(self._live_action_rules)} live-action rules, "
+            f"RuleEngine initialized: {len(self._live_action_rules)} live-action rules "
+            f"in {len(self._rules_by_trigger)} trigger groups, "
             f"{len(self._animation_rules)} animation rules"
         )
 
     def validate_live_action(self, config: LiveActionConfig) -> ValidationResult:
         """Validate a live-action configuration against all rules."""
+        ctx = ShotContext.from_config(config)
         messages = []
-        for rule in self._live_action_rules:
-            msg = rule.evaluate(config)
-            if msg:
-                messages.append(msg)
+        for group, checks in self._checks_by_trigger.items():
+            # Skip a group wholesale when the config doesn't carry it
+            # (partial configs) instead of letting every rule in it
+            # raise and be swallowed individually
+            if group and getattr(config, group, None) is None:
+                continue
+            for check, rule in checks:
+                try:
+                    violated = check(config, ctx)
+                except (AttributeError, TypeError, KeyError) as e:
+                    logger.debug(f"Rule {rule.rule_id} skipped: {e}")
+                    continue
+                if violated:
+                    messages.append(ValidationMessage(
+                        rule_id=rule.rule_id,
+                        severity=rule.severity,
+                        message=rule.message,
+                        field_path=rule.field_path,
+                    ))
 
         if any(m.severity == RuleSeverity.HARD for m in messages):
             status = "invalid"
@@ -240,6 +240,25 @@ class Scheduler:
         )
         return selected
 
+    def mark_offline_before(self, cutoff: datetime) -> list[WorkerInfo]:
+        """Mark every worker with a heartbeat older than cutoff offline.
+
+        One pass over the worker dict against a single precomputed
+        cutoff — no per-worker datetime subtraction — and the status
+        flip happens here, so the caller gets an atomic snapshot of
+        exactly which workers went down.
+        """
+        flipped = []
+        for worker in self._workers.values():
+            if (
+                worker.status != "offline"
+                and worker.last_heartbeat
+                and worker.last_heartbeat < cutoff
+            ):
+                worker.status = "offline"
+                flipped.append(worker)
+        return flipped
+
     def get_all_workers(self) -> list[WorkerInfo]:
         """Get all registered workers."""
         return list(self._workers.values())
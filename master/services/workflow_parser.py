@@ -73,6 +73,7 @@ class WorkflowAnalysis:
         self.lora_nodes: list[str] = []
         self.save_nodes: list[str] = []
         self.image_load_nodes: list[str] = []
+        self.by_role: dict[str, list[WorkflowParameter]] = {}  # role -> parameters
         self.errors: list[str] = []
 
     def to_dict(self) -> dict:
@@ -204,6 +205,11 @@ class WorkflowParser:
                         description="Output filename prefix",
                     ))
 
+        # Index parameters by role so consumers (e.g. ParameterPatcher)
+        # can look up width/height etc. without scanning the full list
+        for param in analysis.parameters:
+            analysis.by_role.setdefault(param.role, []).append(param)
+
         logger.info(
             f"Workflow analysis: {len(analysis.parameters)} params, "
             f"{len(analysis.positive_prompt_nodes)} positive, "
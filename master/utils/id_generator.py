@@ -6,7 +6,7 @@ Provides server-side sequential ID generation with prefixes.
 
 import uuid
 from datetime import datetime
-from typing import Optional
+from typing import Iterable, Optional
 
 
 class IDGenerator:
@@ -29,7 +29,7 @@ class IDGenerator:
     }
     
     @classmethod
-    def generate_shot_id(cls, existing_ids: Optional[list] = None) -> str:
+    def generate_shot_id(cls, existing_ids: Optional[Iterable[str]] = None) -> str:
         """Generate a unique shot ID with 10-step increment. Format: SHT-XXXXX (e.g., SHT-00010)."""
         max_val = 0
         